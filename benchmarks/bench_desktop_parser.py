@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Porównanie starego parsera .desktop (load_apps) z parse_desktop_file na syntetycznym korpusie.
+
+Uruchomienie:
+    python3 benchmarks/bench_desktop_parser.py [--entries 5000] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import smarttv  # noqa: E402
+
+
+def legacy_parse(path):
+    """Parser z load_apps sprzed zmiany (cały plik, podciąg 'NoDisplay=true', split na pierwszym '=')"""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+        if 'NoDisplay=true' not in content and 'Hidden=true' not in content:
+            name = None
+            exec_line = None
+            for line in content.split('\n'):
+                if line.startswith('Name='):
+                    name = line.split('=')[1]
+                elif line.startswith('Exec='):
+                    exec_line = line.split('=')[1]
+                    exec_line = exec_line.split('%')[0].strip()
+                    if exec_line.startswith('"') and exec_line.endswith('"'):
+                        exec_line = exec_line[1:-1]
+                elif line.startswith('Icon='):
+                    line.split('=')[1]
+            if name and exec_line:
+                return {"name": name, "exec": exec_line, "file": path}
+    return None
+
+
+def make_entry(i, rng):
+    """Plik podobny do prawdziwych: tłumaczenia, komentarze, akcje, czasem NoDisplay w akcji"""
+    lines = ['[Desktop Entry]', 'Type=Application', f'Name=Application {i}']
+    for lang in rng.sample(['pl', 'de', 'fr', 'es', 'it', 'pt_BR', 'ja', 'zh_CN', 'ru', 'cs'], 6):
+        lines.append(f'Name[{lang}]=Aplikacja {i} ({lang})')
+        lines.append(f'Comment[{lang}]=Opis aplikacji numer {i} w języku {lang}')
+    lines.append(f'Exec=env GDK_BACKEND=x11 app{i} --mode=tv %U')
+    lines.append(f'Icon=app{i}')
+    lines.append('Categories=AudioVideo;Player;')
+    lines.append(f'Keywords=media;video;app{i};')
+    if i % 10 == 0:
+        lines.append('NoDisplay=true')
+    for action in range(rng.randint(0, 3)):
+        lines += ['', f'[Desktop Action action{action}]', f'Name=Action {action}',
+                  f'Exec=app{i} --action={action}']
+        if action == 1:
+            lines.append('NoDisplay=true')
+    return '\n'.join(lines) + '\n'
+
+
+def bench(parse, paths, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [parse(p) for p in paths]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--entries', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(1234)
+    with tempfile.TemporaryDirectory() as corpus:
+        paths = []
+        for i in range(args.entries):
+            path = os.path.join(corpus, f'app{i}.desktop')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(make_entry(i, rng))
+            paths.append(path)
+
+        legacy_time, legacy = bench(legacy_parse, paths, args.repeat)
+        new_time, new = bench(lambda p: smarttv.parse_desktop_file(p, 'pl', []), paths, args.repeat)
+
+    wrong_name = sum(1 for old in legacy if old and not old['name'].startswith('Application'))
+    wrong_exec = sum(1 for old in legacy if old and '--mode=tv' not in old['exec'])
+    print(f"corpus: {args.entries} entries, best of {args.repeat}")
+    print(f"{'parser':<12}{'total [ms]':>12}{'per entry [us]':>16}{'shown':>8}")
+    print(f"{'legacy':<12}{legacy_time * 1000:>12.1f}{legacy_time / len(paths) * 1e6:>16.1f}"
+          f"{sum(1 for r in legacy if r):>8}")
+    print(f"{'streaming':<12}{new_time * 1000:>12.1f}{new_time / len(paths) * 1e6:>16.1f}"
+          f"{sum(1 for r in new if r):>8}")
+    print(f"legacy errors: {wrong_name} names taken from [Desktop Action], "
+          f"{wrong_exec} Exec lines truncated at '='")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Pamięć listy filmów i aplikacji: stare słowniki vs rekordy MediaEntry/AppEntry ze __slots__.
+
+Uruchomienie:
+    python3 benchmarks/bench_entry_memory.py [--sizes 10000 100000 1000000] [--per-dir 40]
+
+Ścieżki są syntetyczne (seriale po --per-dir odcinków w folderze), pliki nie istnieją.
+Mierzymy tracemalloc-iem wszystko, co zostaje zaalokowane przy budowaniu listy,
+łącznie z kluczami sortowania i napisami ścieżek.
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import smarttv  # noqa: E402
+
+
+def legacy_sort_key(name):
+    """sort_key sprzed zmiany - krotka fragmentów plus nazwa"""
+    parts = smarttv.NATURAL_CHUNKS.split(name)
+    parts[0::2] = [smarttv.collate_text(part) for part in parts[0::2]]
+    parts[1::2] = [int(part) for part in parts[1::2]]
+    return tuple(parts), name
+
+
+def legacy_media(path, size, mtime):
+    """MediaLibrary.to_media sprzed zmiany"""
+    name = os.path.splitext(os.path.basename(path))[0]
+    return {
+        "name": name,
+        "sort_key": legacy_sort_key(name),
+        "path": path,
+        "size": size,
+        "mtime": mtime,
+        "duration": None,
+        "width": None,
+        "height": None,
+        "video_codec": None,
+        "audio_codec": None
+    }
+
+
+def legacy_app(desktop_id, name, exec_line, path, icon_name):
+    """Wpis all_apps sprzed zmiany - słownik z parse_desktop_file uzupełniony o id i sort_key"""
+    return {"name": name, "exec": exec_line, "file": path, "icon_name": icon_name,
+            "id": desktop_id, "sort_key": legacy_sort_key(name)}
+
+
+def media_rows(count, per_dir):
+    """Wiersze jak z tabeli files: (dir, name, size, mtime); katalogi jako osobne napisy, jak z SQLite"""
+    for i in range(count):
+        show, episode = divmod(i, per_dir)
+        directory = ''.join(['/media/videos/Serial ', str(show), '/Sezon 1'])
+        yield directory, f"Serial {show} S01E{episode + 1:02d} 1080p.mkv", 1_500_000_000 + i, 1_700_000_000.0 + i
+
+
+def app_rows(count):
+    for i in range(count):
+        yield (f"org.example.App{i}.desktop", f"Aplikacja {i}", f"app{i} --mode=tv",
+               f"/usr/share/applications/org.example.App{i}.desktop", f"org.example.App{i}")
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    entries = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entries
+    gc.collect()
+    return size, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--per-dir', type=int, default=40)
+    args = parser.parse_args()
+
+    layouts = [
+        ('media dict', lambda n: [legacy_media(os.path.join(d, f), s, m) for d, f, s, m in media_rows(n, args.per_dir)]),
+        ('MediaEntry', lambda n: [smarttv.MediaEntry(d, f, s, m) for d, f, s, m in media_rows(n, args.per_dir)]),
+        ('app dict', lambda n: [legacy_app(*row) for row in app_rows(n)]),
+        ('AppEntry', lambda n: [smarttv.AppEntry(*row) for row in app_rows(n)]),
+    ]
+    print(f"{'layout':<12}{'entries':>10}{'total [MB]':>12}{'per entry [B]':>15}{'build [s]':>11}")
+    for count in args.sizes:
+        for label, build in layouts:
+            size, elapsed = measure(lambda: build(count))
+            print(f"{label:<12}{count:>10}{size / 2**20:>12.1f}{size / count:>15.0f}{elapsed:>11.2f}")
+
+
+if __name__ == '__main__':
+    main()
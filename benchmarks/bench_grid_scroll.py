@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Opóźnienie jednego kroku przewijania siatki: stare niszczenie/tworzenie przycisków vs TileGrid.
+
+Uruchomienie (potrzebny serwer X, np. na docelowym HTPC albo xvfb-run):
+    python3 benchmarks/bench_grid_scroll.py [--items 500] [--steps 300] [--visible 8]
+
+Każdy krok to przesunięcie okna o jeden element (jak move_selection/scroll_down)
+plus update_idletasks(), więc wynik obejmuje też przeliczenie geometrii i rysowanie.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import tkinter as tk
+from tkinter import ttk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import smarttv  # noqa: E402
+
+
+def legacy_render(frame, items, icon):
+    """update_apps_display sprzed zmiany"""
+    for widget in frame.winfo_children():
+        widget.destroy()
+    for i, item in enumerate(items):
+        btn = ttk.Button(frame, text=f"  {item}", style='Dark.TButton', image=icon,
+                         compound='left', command=lambda a=item: None)
+        btn.grid(row=i // 4, column=i % 4, padx=5, pady=5, sticky='ew')
+
+
+def run(root, render, items, visible, steps):
+    latencies = []
+    for step in range(steps):
+        offset = step % (len(items) - visible)
+        start = time.perf_counter()
+        render(items[offset:offset + visible])
+        root.update_idletasks()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def summary(name, latencies):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{name:<10}{statistics.mean(latencies):>10.2f}{statistics.median(latencies):>10.2f}"
+          f"{p95:>10.2f}{latencies[-1]:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=500)
+    parser.add_argument('--steps', type=int, default=300)
+    parser.add_argument('--visible', type=int, default=8)
+    args = parser.parse_args()
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        sys.exit(f"No display available: {e}")
+    root.geometry('1280x720')
+    ttk.Style().theme_use('clam')
+    ttk.Style().configure('Dark.TButton', padding=10)
+    icon = tk.PhotoImage(width=32, height=32)
+    icon.put('#888888', to=(0, 0, 32, 32))
+    items = [f"Application {i}" for i in range(args.items)]
+
+    legacy_frame = ttk.Frame(root)
+    legacy_frame.pack()
+    legacy = run(root, lambda shown: legacy_render(legacy_frame, shown, icon), items, args.visible, args.steps)
+    legacy_frame.destroy()
+
+    grid_frame = ttk.Frame(root)
+    grid_frame.pack()
+    grid = smarttv.TileGrid(grid_frame, lambda item: None)
+    recycled = run(root, lambda shown: grid.render(shown, lambda item: (f"  {item}", icon)),
+                   items, args.visible, args.steps)
+
+    print(f"per scroll step [ms], {args.steps} steps, {args.visible} visible tiles")
+    print(f"{'grid':<10}{'mean':>10}{'median':>10}{'p95':>10}{'max':>10}")
+    summary('legacy', legacy)
+    summary('TileGrid', recycled)
+    root.destroy()
+
+
+if __name__ == '__main__':
+    main()
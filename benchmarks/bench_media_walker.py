@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Skan syntetycznego drzewa (~1M plików) przez ParallelWalker z opóźnieniem jak na NFS/SMB.
+
+Uruchomienie:
+    python3 benchmarks/bench_media_walker.py [--fanout 10] [--depth 3] [--files 1000] [--latency-ms 5]
+
+Drzewo nie istnieje na dysku - FakeFS podstawia scandir() i stat() i usypia wątek na
+każde wywołanie, tak jak robi to zdalny serwer plików. Porównujemy przejście
+sekwencyjne (1 wątek, odpowiednik os.walk) z równoległym.
+"""
+import argparse
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import smarttv  # noqa: E402
+
+
+class FakeEntry:
+    __slots__ = ('name', 'path', '_dir', '_fs')
+
+    def __init__(self, fs, parent, name, is_dir):
+        self._fs = fs
+        self.name = name
+        self.path = f"{parent}/{name}"
+        self._dir = is_dir
+
+    def is_dir(self, follow_symlinks=True):
+        return self._dir  # d_type - bez opóźnienia
+
+    def is_symlink(self):
+        return False
+
+    def stat(self):
+        return self._fs.file_stat
+
+
+class FakeScandir:
+    def __init__(self, entries):
+        self.entries = entries
+
+    def __enter__(self):
+        return iter(self.entries)
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeFS:
+    """Drzewo fanout^depth katalogów z `files` filmami w każdym liściu"""
+
+    def __init__(self, fanout, depth, files, latency):
+        self.fanout = fanout
+        self.depth = depth
+        self.files = files
+        self.latency = latency
+        self.inodes = {}
+        self.file_stat = SimpleNamespace(st_size=1 << 30, st_mtime_ns=1)
+        self.calls = 0
+
+    def stat(self, path):
+        time.sleep(self.latency)
+        self.calls += 1
+        ino = self.inodes.setdefault(path, len(self.inodes) + 1)
+        return SimpleNamespace(st_dev=1, st_ino=ino, st_mtime_ns=1)
+
+    def scandir(self, path):
+        time.sleep(self.latency)
+        self.calls += 1
+        level = path.count('/') - 1
+        if level < self.depth:
+            entries = [FakeEntry(self, path, f"d{i}", True) for i in range(self.fanout)]
+        else:
+            entries = [FakeEntry(self, path, f"movie{i}.mkv", False) for i in range(self.files)]
+        return FakeScandir(entries)
+
+
+def run(fs, workers):
+    walker = smarttv.ParallelWalker(workers_per_mount=workers, max_workers=workers,
+                                    scandir=fs.scandir, stat=fs.stat)
+    start = time.perf_counter()
+    dirs = files = 0
+    for listing in walker.walk('/nas'):
+        dirs += 1
+        files += len(listing.files)
+    return time.perf_counter() - start, dirs, files
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--fanout', type=int, default=10)
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--files', type=int, default=1000, help="filmów w każdym katalogu-liściu")
+    parser.add_argument('--latency-ms', type=float, default=5.0, help="opóźnienie każdego stat/scandir")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8, 16])
+    args = parser.parse_args()
+
+    print(f"tree: fanout {args.fanout}, depth {args.depth}, {args.files} files per leaf, "
+          f"{args.latency_ms} ms per call")
+    print(f"{'workers':>8}{'time [s]':>12}{'dirs':>10}{'files':>12}{'files/s':>12}")
+    for workers in args.workers:
+        fs = FakeFS(args.fanout, args.depth, args.files, args.latency_ms / 1000)
+        elapsed, dirs, files = run(fs, workers)
+        print(f"{workers:>8}{elapsed:>12.2f}{dirs:>10}{files:>12}{files / elapsed:>12.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Raport czasu importu modułów przy starcie launchera (przed i po leniwych importach).
+
+Uruchomienie:
+    python3 benchmarks/import_report.py [--runs N]
+
+"Przed" - moduły importowane na starcie tak jak w wersji bez leniwych importów.
+"Po"    - to, co faktycznie importuje `import smarttv` po zmianie.
+Każdy pomiar to osobny proces `python -X importtime`, więc cache modułów nie przekłamuje wyniku.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Moduły ładowane na starcie przed zmianą (kolejność jak w starym nagłówku smarttv.py)
+EAGER_MODULES = ['tkinter', 'webview', 'qtpy', 'pytz', 'PIL.Image', 'PIL.ImageTk',
+                 'PIL.ImageOps', 'PIL.ImageEnhance', 'PIL.ImageFilter', 'requests']
+# Biblioteka standardowa używana dopiero po pierwszym narysowaniu - też nie może wrócić na start
+DEFERRED_MODULES = ['ctypes', 'ctypes.util', 'configparser', 'sqlite3', 'mmap', 'hashlib', 'socket',
+                    'urllib.parse']
+
+
+def measure(statement):
+    """Zwraca {moduł: skumulowany czas importu w ms} dla każdego zaimportowanego modułu"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=REPO_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, package = line[len('import time:'):].split('|')
+        times[package.strip()] = int(cumulative) / 1000.0
+    return times, result.returncode
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help="liczba powtórzeń (bierzemy medianę)")
+    args = parser.parse_args()
+
+    before_runs, after_runs = [], []
+    for _ in range(args.runs):
+        # Import każdego modułu osobno, żeby brak jednego nie przerwał pomiaru
+        before_stmt = '\n'.join(f"try:\n import {m}\nexcept ImportError:\n pass"
+                                for m in EAGER_MODULES + DEFERRED_MODULES)
+        before_runs.append(measure(before_stmt)[0])
+        after, code = measure('import smarttv')
+        if code != 0:
+            sys.exit("import smarttv failed - run from a full build environment")
+        after_runs.append(after)
+
+    def median(runs, name):
+        values = sorted(run.get(name, 0.0) for run in runs)
+        return values[len(values) // 2]
+
+    print(f"{'module':<22}{'before [ms]':>14}{'after [ms]':>14}")
+    print('-' * 50)
+    total_before = total_after = 0.0
+    for name in EAGER_MODULES + DEFERRED_MODULES:
+        before, after = median(before_runs, name), median(after_runs, name)
+        total_before += before
+        total_after += after
+        print(f"{name:<22}{before:>14.1f}{after:>14.1f}")
+    print('-' * 50)
+    print(f"{'total':<22}{total_before:>14.1f}{total_after:>14.1f}")
+    print(f"{'import smarttv':<22}{'':>14}{median(after_runs, 'smarttv'):>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
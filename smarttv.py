@@ -1,18 +1,129 @@
 #!/usr/bin/env python3
+import time
+STARTUP_T0 = time.perf_counter()  # Początek startu procesu (dla --profile-startup)
 import tkinter as tk
 from tkinter import ttk, messagebox, Menu, simpledialog, filedialog, colorchooser
+import tkinter.font as tkfont
 import os
 import subprocess
 import datetime
-import webview
-import qtpy
 import sys
 import json
-import pytz
-from PIL import Image, ImageTk, ImageOps, ImageEnhance, ImageFilter
-import requests
+import argparse
+import contextlib
+import logging
+import platform
+import importlib
+import importlib.util
+import queue
+import re
+import threading
+import bisect
+import struct
+import io
+import math
+from collections import OrderedDict
+from collections.abc import Sequence
 import tempfile
 import shutil
+import locale
+import unicodedata
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# --- Leniwe importy (Lazy imports) ---
+# Czas importu każdego leniwie ładowanego modułu (w sekundach)
+IMPORT_TIMES = {}
+
+
+def lazy_import(name):
+    """Importuje moduł i zapamiętuje czas pierwszego importu"""
+    if name in sys.modules:
+        return sys.modules[name]
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    IMPORT_TIMES[name] = time.perf_counter() - start
+    return module
+
+
+class LazyModule:
+    """Pośrednik, który importuje moduł dopiero przy pierwszym użyciu atrybutu"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = lazy_import(self._name)
+        return getattr(self._module, attr)
+
+
+# --- Logowanie (Logging) ---
+log = logging.getLogger('tv_launcher')
+# Kategorie - każda ma własny limit komunikatów
+apps_log = log.getChild('apps')
+scan_log = log.getChild('scan')
+ui_log = log.getChild('ui')
+config_log = log.getChild('config')
+player_log = log.getChild('player')
+
+
+class RateLimitFilter(logging.Filter):
+    """Przepuszcza najwyżej `limit` komunikatów na kategorię (logger) w oknie `interval` sekund"""
+
+    def __init__(self, limit=20, interval=10.0):
+        super().__init__()
+        self.limit = limit
+        self.interval = interval
+        self.windows = {}  # nazwa loggera -> [początek okna, przepuszczone, pominięte]
+        self.lock = threading.Lock()
+
+    def filter(self, record):
+        now = time.monotonic()
+        with self.lock:
+            window = self.windows.get(record.name)
+            if window is None or now - window[0] >= self.interval:
+                if window and window[2]:
+                    record.msg = f"{record.msg} [{window[2]} earlier messages suppressed]"
+                self.windows[record.name] = [now, 1, 0]
+                return True
+            if window[1] < self.limit:
+                window[1] += 1
+                return True
+            window[2] += 1
+            return False
+
+
+def setup_logging(level='INFO'):
+    """Konfiguruje log na stderr; poza trybem DEBUG z limitem komunikatów na kategorię"""
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s', '%H:%M:%S'))
+    level = getattr(logging, str(level).upper(), logging.INFO)
+    if level > logging.DEBUG:
+        handler.addFilter(RateLimitFilter())
+    log.addHandler(handler)
+    log.setLevel(level)
+    log.propagate = False
+
+
+# Ciężkie moduły - potrzebne tylko przy streamingu, aktualizacji, zegarze i tle
+webview = LazyModule('webview')
+pytz = LazyModule('pytz')
+requests = LazyModule('requests')
+Image = LazyModule('PIL.Image')
+ImageTk = LazyModule('PIL.ImageTk')
+ImageEnhance = LazyModule('PIL.ImageEnhance')
+ImageFilter = LazyModule('PIL.ImageFilter')
+# Biblioteka standardowa potrzebna dopiero po pierwszym narysowaniu (inotify, indeksy,
+# miniatury, VLC) - razem kilkadziesiąt ms importu, które nie opóźniają startu
+ctypes = LazyModule('ctypes')
+configparser = LazyModule('configparser')
+sqlite3 = LazyModule('sqlite3')
+mmap = LazyModule('mmap')
+hashlib = LazyModule('hashlib')
+socket = LazyModule('socket')
+urllib_parse = LazyModule('urllib.parse')
 
 # --- Słownik Tłumaczeń (Translations) ---
 DEFAULT_TRANSLATIONS = {
@@ -112,19 +223,2038 @@ DEFAULT_TRANSLATIONS = {
         'language_download_fail': "Error downloading language file %s. Check if it exists in the repository.",
         'language_load_fail': "Error loading downloaded language file.",
         'language_download_success': "Language %s downloaded and loaded! Restart the app to see changes.",
+        'scan_progress': "Scanning videos: %d folders, %d files (%d files/s) - Esc to cancel",
+        'scan_cancelled': "Video scan cancelled",
     }
 }
 # Folder, gdzie będą zapisywane pobrane pliki językowe
 LANG_DIR = os.path.expanduser('~/.tv_launcher_lang')
+# Folder na trwałe indeksy (aplikacje, multimedia)
+CACHE_DIR = os.path.expanduser('~/.tv_launcher_cache')
+APPS_INDEX_FILE = os.path.join(CACHE_DIR, 'apps_index.json')
+MEDIA_DB_FILE = os.path.join(CACHE_DIR, 'media.db')
+MEDIA_SNAPSHOT_FILE = os.path.join(CACHE_DIR, 'media.snapshot')
+VIDEO_EXTENSIONS = {'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.3gp'}
+# Rozmiar ikon aplikacji w siatce (px)
+APP_ICON_SIZE = 32
+# Miniatury filmów (PNG, klucz: ścieżka + rozmiar + mtime pliku)
+THUMBNAIL_DIR = os.path.join(CACHE_DIR, 'thumbnails')
+THUMBNAIL_SIZE = (96, 54)
+# Domyślny plik z profilem startu (--profile-startup)
+STARTUP_PROFILE_FILE = os.path.expanduser('~/.tv_launcher_startup.json')
+
+
+class StartupProfiler:
+    """Zbiera czasy faz startu (wall i CPU) oraz czas do pierwszego narysowania okna"""
+    # Po zapisaniu tych zdarzeń start jest zakończony i profil się zamyka
+    STARTUP_EVENTS = ('apps_ready', 'icon_theme_ready', 'media_ready')
+
+    def __init__(self, output_path=None):
+        self.enabled = output_path is not None
+        self.output_path = output_path
+        self.phases = []
+        self.first_paint = None
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Mierzy czas jednej fazy startu"""
+        if not self.enabled:
+            yield
+            return
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            self.phases.append({
+                'name': name,
+                'start_ms': (wall_start - STARTUP_T0) * 1000,
+                'wall_ms': (time.perf_counter() - wall_start) * 1000,
+                'cpu_ms': (time.process_time() - cpu_start) * 1000
+            })
+
+    def mark(self, name):
+        """Zapisuje pierwsze wystąpienie zdarzenia (np. koniec skanowania w tle)"""
+        if not self.enabled or any(phase['name'] == name for phase in self.phases):
+            return
+        self.phases.append({
+            'name': name,
+            'start_ms': (time.perf_counter() - STARTUP_T0) * 1000,
+            'wall_ms': 0.0,
+            'cpu_ms': 0.0
+        })
+        if self.first_paint is not None:
+            self.flush()
+
+    def mark_first_paint(self, root):
+        """Wywoływane z pętli Tk - zapisuje czas do pierwszej klatki i raport"""
+        if not self.enabled or self.first_paint is not None:
+            return
+        root.update_idletasks()  # Wymuś narysowanie oczekujących widżetów
+        self.first_paint = (time.perf_counter() - STARTUP_T0) * 1000
+        self.flush()
+
+    def flush(self):
+        """Zapisuje raport; gdy są już wszystkie STARTUP_EVENTS, wyłącza dalsze pomiary"""
+        self.write()
+        recorded = {phase['name'] for phase in self.phases}
+        if recorded.issuperset(self.STARTUP_EVENTS):
+            # Ponowne skany i zmiana folderu to już nie start - nie trafiają do profilu
+            self.enabled = False
+
+    def report(self):
+        return {
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'host': platform.node(),
+            'python': platform.python_version(),
+            'argv': sys.argv[1:],
+            'first_paint_ms': self.first_paint,
+            'cpu_total_ms': time.process_time() * 1000,
+            'phases': self.phases,
+            'imports_ms': {name: t * 1000 for name, t in IMPORT_TIMES.items()}
+        }
+
+    def format_table(self):
+        lines = [f"{'phase':<24}{'start [ms]':>12}{'wall [ms]':>12}{'cpu [ms]':>12}", '-' * 60]
+        for phase in self.phases:
+            lines.append(f"{phase['name']:<24}{phase['start_ms']:>12.1f}"
+                         f"{phase['wall_ms']:>12.1f}{phase['cpu_ms']:>12.1f}")
+        lines.append('-' * 60)
+        for name, seconds in IMPORT_TIMES.items():
+            lines.append(f"{'import ' + name:<24}{'':>12}{seconds * 1000:>12.1f}")
+        lines.append(f"{'first paint':<24}{self.first_paint or 0:>12.1f}")
+        return '\n'.join(lines)
+
+    def write(self):
+        """Zapisuje profil jako JSON i czytelną tabelę (.txt obok)"""
+        table = self.format_table()
+        print(table)
+        try:
+            with open(self.output_path, 'w') as f:
+                json.dump(self.report(), f, indent=4)
+            with open(os.path.splitext(self.output_path)[0] + '.txt', 'w') as f:
+                f.write(table + '\n')
+        except Exception as e:
+            log.error("Error saving startup profile: %s", e)
+
+
+# --- Sortowanie (Sorting) ---
+
+# Liczby w nazwach porównujemy jako liczby: "Odcinek 2" przed "Odcinek 10"
+NATURAL_CHUNKS = re.compile(r'(\d+)')
+
+
+# Litery, których NFKD nie rozkłada na literę bazową i znak diakrytyczny
+FOLD_LETTERS = str.maketrans({'ł': 'l', 'Ł': 'L', 'ø': 'o', 'Ø': 'O', 'đ': 'd', 'Đ': 'D', 'ħ': 'h', 'Ħ': 'H'})
+
+
+def fold_accents(text):
+    """Zastępcza kolacja bez locale: bez wielkości liter i znaków diakrytycznych"""
+    if text.isascii():
+        return text.casefold()
+    text = unicodedata.normalize('NFKD', text.translate(FOLD_LETTERS))
+    return ''.join(c for c in text if not unicodedata.combining(c)).casefold()
+
+
+collate_text = fold_accents
+# Locale aktywnej kolacji (None - zastępcza); klucze zapisane na dysku są ważne tylko dla niej
+collation_name = None
+
+
+def set_collation_language(language):
+    """Ustawia LC_COLLATE dla języka interfejsu; zwraca nazwę locale albo None (kolacja zastępcza)
+
+    Wołać raz przy starcie, przed liczeniem kluczy - setlocale działa na cały proces.
+    """
+    global collate_text, collation_name
+    base = locale.normalize(language).split('.')[0]  # 'pl' -> 'pl_PL'
+    for candidate in (f"{base}.UTF-8", f"{base}.utf8", base):
+        try:
+            locale.setlocale(locale.LC_COLLATE, candidate)
+        except locale.Error:
+            continue
+        collate_text = locale.strxfrm
+        collation_name = candidate
+        return candidate
+    collate_text = fold_accents
+    collation_name = None
+    return None
+
+
+def sort_key(name):
+    """Klucz sortowania naturalnego wg kolacji aktywnego języka - liczony raz i trzymany we wpisie
+
+    Jeden napis zamiast krotki fragmentów (mniej pamięci, szybsze porównania):
+    tekst kończy \\0, liczba to \\1 + długość + cyfry, a \\0\\0 + nazwa na końcu
+    rozstrzyga remisy, więc równe klucze oznaczają równe nazwy.
+    """
+    key = []
+    for i, part in enumerate(NATURAL_CHUNKS.split(name)):
+        if i % 2:
+            digits = str(int(part))
+            key.append(f"\1{chr(0x30 + len(digits))}{digits}")
+        else:
+            key.append(collate_text(part) + '\0')
+    key.append('\0' + name)
+    return ''.join(key)
+
+
+# --- Pliki .desktop (Desktop entries) ---
+
+DESKTOP_ENTRY_GROUP = '[Desktop Entry]'
+DESKTOP_KEYS = {'Type', 'Name', 'Exec', 'Icon', 'TryExec', 'NoDisplay', 'Hidden', 'OnlyShowIn', 'NotShowIn'}
+# Linie, które parser musi obejrzeć: nagłówki grup i znane klucze
+DESKTOP_LINE_PREFIXES = ('[',) + tuple(DESKTOP_KEYS)
+# Kody pól w Exec (%f, %U, %i...) - usuwane, bo launcher nie przekazuje plików
+EXEC_FIELD_CODE = re.compile(r'%([%fFuUdDnNickvm])')
+
+
+def current_desktops():
+    """Lista środowisk z $XDG_CURRENT_DESKTOP (dla OnlyShowIn/NotShowIn)"""
+    return [d for d in os.environ.get('XDG_CURRENT_DESKTOP', '').split(':') if d]
+
+
+def locale_candidates(language):
+    """Klucze lokalizacji w kolejności ze specyfikacji: lang_COUNTRY@MOD, lang_COUNTRY, lang@MOD, lang"""
+    language = (language or '').split('.')[0]
+    lang, _, modifier = language.partition('@')
+    lang, _, country = lang.partition('_')
+    candidates = []
+    if country and modifier:
+        candidates.append(f"{lang}_{country}@{modifier}")
+    if country:
+        candidates.append(f"{lang}_{country}")
+    if modifier:
+        candidates.append(f"{lang}@{modifier}")
+    if lang:
+        candidates.append(lang)
+    return candidates
+
+
+def unescape_desktop_value(value):
+    """Zamienia sekwencje \\s \\n \\t \\r \\\\ na znaki"""
+    if '\\' not in value:
+        return value
+    out = []
+    chars = iter(value)
+    for ch in chars:
+        if ch == '\\':
+            nxt = next(chars, '')
+            out.append({'s': ' ', 'n': '\n', 't': '\t', 'r': '\r', '\\': '\\'}.get(nxt, '\\' + nxt))
+        else:
+            out.append(ch)
+    return ''.join(out)
+
+
+def is_executable_available(program):
+    """Sprawdza TryExec: ścieżka bezwzględna lub program w $PATH"""
+    if os.path.isabs(program):
+        return os.access(program, os.X_OK)
+    return shutil.which(program) is not None
+
+
+def parse_desktop_file(path, language='en', desktops=None):
+    """Parsuje plik .desktop; zwraca słownik aplikacji albo None, jeśli jest ukryta
+
+    Czyta plik linia po linii tylko do końca grupy [Desktop Entry] - na następnym
+    nagłówku przerywa, więc [Desktop Action ...] nie są czytane ani nie nadpisują wartości.
+    """
+    keys = {}
+    localized_names = {}
+    in_group = False
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                # Szybkie odrzucenie Comment=, Keywords= itd. jednym wywołaniem
+                if not line.startswith(DESKTOP_LINE_PREFIXES):
+                    continue
+                if line[0] == '[':
+                    if in_group:
+                        break  # Następna grupa - reszty pliku nie czytamy
+                    in_group = line.rstrip() == DESKTOP_ENTRY_GROUP
+                    continue
+                if not in_group:
+                    continue
+                key, sep, value = line.partition('=')
+                if not sep:
+                    continue
+                key = key.strip()
+                if key in DESKTOP_KEYS:
+                    keys[key] = value.strip()
+                elif key.startswith('Name[') and key.endswith(']'):
+                    localized_names[key[5:-1]] = value.strip()
+    except Exception as e:
+        apps_log.warning("Error loading %s: %s", os.path.basename(path), e)
+        return None
+    if not keys:
+        return None  # Brak grupy [Desktop Entry]
+
+    if keys.get('Type', 'Application') != 'Application':
+        return None
+    if keys.get('NoDisplay') == 'true' or keys.get('Hidden') == 'true':
+        return None
+
+    if desktops is None:
+        desktops = current_desktops()
+    only_show_in = [d for d in keys.get('OnlyShowIn', '').split(';') if d]
+    not_show_in = [d for d in keys.get('NotShowIn', '').split(';') if d]
+    if only_show_in and not set(only_show_in) & set(desktops):
+        return None
+    if set(not_show_in) & set(desktops):
+        return None
+
+    name = keys.get('Name')
+    for loc in locale_candidates(language) if localized_names else ():
+        if loc in localized_names:
+            name = localized_names[loc]
+            break
+    exec_line = unescape_desktop_value(keys.get('Exec', ''))
+    exec_line = EXEC_FIELD_CODE.sub(lambda m: '%' if m.group(1) == '%' else '', exec_line)
+    exec_line = ' '.join(exec_line.split())
+
+    if name and exec_line:
+        entry = {
+            "name": unescape_desktop_value(name),
+            "exec": exec_line,
+            "file": path,
+            "icon_name": unescape_desktop_value(keys.get('Icon', ''))
+        }
+        # TryExec zależy od $PATH i zainstalowanych programów, nie od pliku - sprawdza go
+        # dopiero available_entry przy odczycie, żeby indeks nie zapamiętał wyniku
+        try_exec = unescape_desktop_value(keys.get('TryExec', ''))
+        if try_exec:
+            entry["try_exec"] = try_exec
+        return entry
+    return None
+
+
+def available_entry(entry):
+    """Kopia wpisu z parse_desktop_file albo None, gdy program z TryExec nie jest dostępny"""
+    if not entry:
+        return None
+    try_exec = entry.get('try_exec')
+    if try_exec and not is_executable_available(try_exec):
+        return None
+    return dict(entry)
+
+
+def xdg_data_dirs():
+    """XDG_DATA_HOME i XDG_DATA_DIRS w kolejności pierwszeństwa - tylko tu szuka gtk-launch"""
+    data_home = os.environ.get('XDG_DATA_HOME') or os.path.expanduser('~/.local/share')
+    data_dirs = [d for d in os.environ.get('XDG_DATA_DIRS', '').split(':') if d]
+    return [data_home] + (data_dirs or ['/usr/local/share', '/usr/share'])
+
+
+def application_dirs():
+    """Katalogi applications w kolejności pierwszeństwa (XDG, Flatpak, Snap)"""
+    extra_dirs = [
+        os.path.expanduser('~/.local/share/flatpak/exports/share'),
+        '/var/lib/flatpak/exports/share',
+        '/var/lib/snapd/desktop'
+    ]
+
+    dirs = []
+    seen = set()
+    for data_dir in xdg_data_dirs() + extra_dirs:
+        app_dir = os.path.join(data_dir, 'applications')
+        real = os.path.realpath(app_dir)
+        if real not in seen and os.path.isdir(app_dir):
+            seen.add(real)
+            dirs.append(app_dir)
+    return dirs
+
+
+def desktop_file_id(base_dir, app_dir, name):
+    """Desktop ID wg specyfikacji: podkatalogi względem applications łączone '-'"""
+    rel = os.path.relpath(app_dir, base_dir)
+    return name if rel == '.' else rel.replace(os.sep, '-') + '-' + name
+
+
+class AppEntry:
+    """Aplikacja na liście - rekord ze __slots__ zamiast słownika z pliku .desktop"""
+    __slots__ = ('id', 'name', 'exec', 'file', 'icon_name', 'sort_key')
+
+    def __init__(self, desktop_id, name, exec_line, file, icon_name=''):
+        self.id = desktop_id
+        self.name = name
+        self.exec = exec_line
+        self.file = file
+        self.icon_name = icon_name
+        self.sort_key = sort_key(name)
+
+    @classmethod
+    def from_entry(cls, desktop_id, entry):
+        """Z wpisu parse_desktop_file (w tej postaci trzyma go indeks JSON)"""
+        return cls(desktop_id, entry['name'], entry['exec'], entry['file'], entry.get('icon_name', ''))
+
+
+class DesktopEntryIndex:
+    """Trwały indeks sparsowanych plików .desktop, odświeżany na podstawie mtime"""
+    VERSION = 4
+
+    def __init__(self, path=APPS_INDEX_FILE, language='en', desktops=None):
+        self.path = path
+        self.language = language
+        self.desktops = current_desktops() if desktops is None else desktops
+        # Wynik parsowania zależy od języka (Name[xx]) i środowiska (OnlyShowIn)
+        self.context = [self.language, ':'.join(self.desktops)]
+        # app_dir -> {'mtime': ns, 'files': {nazwa: {'mtime': ns, 'entry': dict lub None}}}
+        self.dirs = {}
+        self.dirty = False
+        self.parsed = 0  # Ile plików sparsowano w tej sesji (do podsumowania skanu)
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == self.VERSION and data.get('context') == self.context:
+                self.dirs = data.get('dirs', {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            apps_log.warning("Error loading apps index: %s", e)
+
+    def save(self):
+        """Zapisuje indeks atomowo (plik tymczasowy + rename), tylko gdy się zmienił"""
+        if not self.dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.VERSION, 'context': self.context, 'dirs': self.dirs},
+                          f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except Exception as e:
+            apps_log.error("Error saving apps index: %s", e)
+
+    def scan_dir(self, app_dir):
+        """Zwraca ([(nazwa, wpis lub None)], podkatalogi), parsując ponownie tylko zmienione pliki"""
+        try:
+            dir_mtime = os.stat(app_dir).st_mtime_ns
+        except OSError:
+            if self.dirs.pop(app_dir, None) is not None:
+                self.dirty = True
+            return [], []
+
+        cached = self.dirs.get(app_dir, {'mtime': None, 'files': {}, 'subdirs': []})
+        if cached['mtime'] == dir_mtime:
+            # Lista plików się nie zmieniła - zachowaj kolejność z poprzedniego skanu
+            names = list(cached['files'])
+            subdirs = cached['subdirs']
+        else:
+            names, subdirs = [], []
+            with os.scandir(app_dir) as it:
+                for item in it:
+                    if item.name.endswith('.desktop'):
+                        names.append(item.name)
+                    elif item.is_dir(follow_symlinks=False):
+                        subdirs.append(item.name)
+            self.dirty = True
+
+        files = {}
+        found = []
+        for name in names:
+            path = os.path.join(app_dir, name)
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                self.dirty = True
+                continue
+            record = cached['files'].get(name)
+            if record is None or record['mtime'] != mtime:
+                record = {'mtime': mtime, 'entry': parse_desktop_file(path, self.language, self.desktops)}
+                self.dirty = True
+                self.parsed += 1
+            files[name] = record
+            found.append((name, available_entry(record['entry'])))
+
+        self.dirs[app_dir] = {'mtime': dir_mtime, 'files': files, 'subdirs': subdirs}
+        return found, subdirs
+
+    def scan_tree(self, app_dir, id_prefix=''):
+        """Skanuje katalog applications z podkatalogami; zwraca [(desktop ID, wpis lub None)]
+
+        Ukryte wpisy (None) też są zwracane, bo nadpisują ten sam ID z dalszych katalogów.
+        """
+        files, subdirs = self.scan_dir(app_dir)
+        found = [(id_prefix + name, entry) for name, entry in files]
+        for sub in subdirs:
+            found.extend(self.scan_tree(os.path.join(app_dir, sub), f"{id_prefix}{sub}-"))
+        return found
+
+    def lookup(self, app_dir, desktop_id):
+        """Szuka desktop ID w zindeksowanym katalogu i podkatalogach; zwraca (znaleziono, wpis)"""
+        cached = self.dirs.get(app_dir)
+        if not cached:
+            return False, None
+        record = cached['files'].get(desktop_id)
+        if record:
+            return True, available_entry(record['entry'])
+        for sub in cached['subdirs']:
+            if desktop_id.startswith(sub + '-'):
+                found, entry = self.lookup(os.path.join(app_dir, sub), desktop_id[len(sub) + 1:])
+                if found:
+                    return found, entry
+        return False, None
+
+    def update_file(self, app_dir, name):
+        """Odświeża jeden plik po zdarzeniu z inotify; zwraca nowy wpis albo None"""
+        path = os.path.join(app_dir, name)
+        cached = self.dirs.setdefault(app_dir, {'mtime': None, 'files': {}, 'subdirs': []})
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            cached['files'].pop(name, None)
+            entry = None
+        else:
+            entry = parse_desktop_file(path, self.language, self.desktops)
+            cached['files'][name] = {'mtime': mtime, 'entry': entry}
+        try:
+            cached['mtime'] = os.stat(app_dir).st_mtime_ns
+        except OSError:
+            pass
+        self.dirty = True
+        return available_entry(entry)
+
+
+class InotifyWatcher:
+    """Minimalna obsługa inotify przez ctypes (bez dodatkowych zależności)"""
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+    def __init__(self):
+        # Symbole libc z samego procesu - find_library('c') uruchamiałby ldconfig
+        self.libc = ctypes.CDLL(None, use_errno=True)
+        self.fd = self.libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches = {}  # wd -> katalog
+
+    def add_watch(self, path, mask):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+        self.watches[wd] = path
+        return wd
+
+    def fileno(self):
+        return self.fd
+
+    def read_events(self):
+        """Zwraca listę (katalog, nazwa pliku, maska) dla oczekujących zdarzeń"""
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+                offset += self.EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+                offset += length
+                events.append((self.watches.get(wd), name, mask))
+        return events
+
+    def close(self):
+        os.close(self.fd)
+
+
+# --- Motywy ikon (Icon themes) ---
+
+def read_ini(path):
+    """Czyta plik w stylu INI z zachowaniem wielkości liter kluczy; None, jeśli się nie da"""
+    parser = configparser.ConfigParser(interpolation=None, strict=False)
+    parser.optionxform = str
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            parser.read_file(f)
+    except (OSError, configparser.Error, UnicodeDecodeError):
+        return None
+    return parser
+
+
+def detect_icon_theme():
+    """Nazwa aktywnego motywu ikon z ustawień KDE lub GTK (domyślnie hicolor)"""
+    sources = [
+        ('~/.config/kdeglobals', 'Icons', 'Theme'),
+        ('~/.config/gtk-4.0/settings.ini', 'Settings', 'gtk-icon-theme-name'),
+        ('~/.config/gtk-3.0/settings.ini', 'Settings', 'gtk-icon-theme-name')
+    ]
+    for path, section, key in sources:
+        parser = read_ini(os.path.expanduser(path))
+        if parser and parser.has_option(section, key):
+            return parser.get(section, key).strip()
+    return 'hicolor'
+
+
+def icon_base_dirs():
+    """Katalogi z motywami ikon w kolejności ze specyfikacji"""
+    dirs = [os.path.expanduser('~/.icons')]
+    dirs += [os.path.join(os.path.dirname(app_dir), 'icons') for app_dir in application_dirs()]
+    return [d for d in dict.fromkeys(dirs) if os.path.isdir(d)]
+
+
+def load_icon_image(path, size):
+    """Wczytuje plik ikony (PNG/XPM przez PIL, SVG przez cairosvg) jako obraz PIL size x size"""
+    if path.endswith('.svg'):
+        png_data = lazy_import('cairosvg').svg2png(url=path, output_width=size, output_height=size)
+        img = Image.open(io.BytesIO(png_data))
+    else:
+        img = Image.open(path)
+    img = img.convert('RGBA')
+    if img.size != (size, size):
+        img.thumbnail((size, size), Image.Resampling.LANCZOS)
+    return img
+
+
+class IconThemeIndex:
+    """Jednorazowy indeks nazwa ikony -> pliki dla aktywnego motywu, jego rodziców i hicolor"""
+    EXTENSIONS = {'.png': 'png', '.svg': 'svg', '.xpm': 'xpm'}
+    # Flagi obrazów w icon-theme.cache (GTK)
+    CACHE_FLAGS = ((4, '.png'), (2, '.svg'), (1, '.xpm'))
+
+    def __init__(self, theme=None):
+        self.base_dirs = icon_base_dirs()
+        self.themes = self.theme_chain(theme or detect_icon_theme())
+        self.svg_supported = importlib.util.find_spec('cairosvg') is not None
+        # nazwa -> [(pozycja motywu, rozmiar, skalowalna, ścieżka)]
+        self.icons = {}
+        self.pixmaps = {}
+
+    def theme_chain(self, theme):
+        """Motyw, motywy z Inherits= (rekurencyjnie) i na końcu hicolor"""
+        chain = []
+        pending = [theme]
+        while pending:
+            name = pending.pop(0)
+            if name in chain:
+                continue
+            chain.append(name)
+            for base in self.base_dirs:
+                parser = read_ini(os.path.join(base, name, 'index.theme'))
+                if parser and parser.has_option('Icon Theme', 'Inherits'):
+                    pending += [t.strip() for t in parser.get('Icon Theme', 'Inherits').split(',') if t.strip()]
+                    break
+        if 'hicolor' in chain:
+            chain.remove('hicolor')
+        return chain + ['hicolor']
+
+    def build(self):
+        for rank, theme in enumerate(self.themes):
+            for base in self.base_dirs:
+                theme_dir = os.path.join(base, theme)
+                if os.path.isdir(theme_dir):
+                    self.index_theme_dir(rank, theme_dir)
+        # Stary fallback spoza motywów
+        for pixmaps_dir in ('/usr/share/pixmaps', os.path.expanduser('~/.local/share/pixmaps')):
+            with contextlib.suppress(OSError):
+                for name in os.listdir(pixmaps_dir):
+                    stem, ext = os.path.splitext(name)
+                    if ext in self.EXTENSIONS:
+                        self.pixmaps.setdefault(stem, os.path.join(pixmaps_dir, name))
+        return self
+
+    def directory_sizes(self, theme_dir):
+        """{podkatalog: (rozmiar, skalowalny)} z index.theme"""
+        sizes = {}
+        parser = read_ini(os.path.join(theme_dir, 'index.theme'))
+        if not parser or not parser.has_section('Icon Theme'):
+            return sizes
+        section = parser['Icon Theme']
+        directories = section.get('Directories', '') + ',' + section.get('ScaledDirectories', '')
+        for sub in filter(None, (d.strip() for d in directories.split(','))):
+            if parser.has_section(sub):
+                info = parser[sub]
+                with contextlib.suppress(ValueError):
+                    sizes[sub] = (int(info.get('Size', 0)), info.get('Type', 'Threshold') == 'Scalable')
+        return sizes
+
+    def add(self, rank, sizes, sub, name, ext, path):
+        size, scalable = sizes.get(sub) or self.guess_size(sub)
+        self.icons.setdefault(name, []).append((rank, size, scalable, path))
+
+    @staticmethod
+    def guess_size(sub):
+        """Rozmiar z nazwy katalogu (48x48/apps, apps/48, scalable/apps) dla motywów bez index.theme"""
+        if 'scalable' in sub:
+            return 0, True
+        match = re.search(r'(\d+)(?:x\d+)?', sub)
+        return (int(match.group(1)) if match else 0), False
+
+    def index_theme_dir(self, rank, theme_dir):
+        sizes = self.directory_sizes(theme_dir)
+        cache_path = os.path.join(theme_dir, 'icon-theme.cache')
+        try:
+            # Cache jest ważny tylko, jeśli jest nowszy od katalogu motywu
+            if os.stat(cache_path).st_mtime >= os.stat(theme_dir).st_mtime:
+                self.read_icon_cache(rank, theme_dir, cache_path, sizes)
+                return
+        except (OSError, struct.error, IndexError):
+            pass
+        for sub in sizes or [d for d in os.listdir(theme_dir) if os.path.isdir(os.path.join(theme_dir, d))]:
+            with contextlib.suppress(OSError):
+                for name in os.listdir(os.path.join(theme_dir, sub)):
+                    stem, ext = os.path.splitext(name)
+                    if ext in self.EXTENSIONS:
+                        self.add(rank, sizes, sub, stem, ext, os.path.join(theme_dir, sub, name))
+
+    def read_icon_cache(self, rank, theme_dir, cache_path, sizes):
+        """Czyta icon-theme.cache (format GTK) bez przechodzenia po katalogach motywu"""
+        with open(cache_path, 'rb') as f:
+            data = f.read()
+
+        def u16(offset):
+            return struct.unpack_from('>H', data, offset)[0]
+
+        def u32(offset):
+            return struct.unpack_from('>I', data, offset)[0]
+
+        def string(offset):
+            return data[offset:data.index(b'\0', offset)].decode('utf-8', 'replace')
+
+        hash_offset, dir_list_offset = u32(4), u32(8)
+        directories = [string(u32(dir_list_offset + 4 + 4 * i)) for i in range(u32(dir_list_offset))]
+        n_buckets = u32(hash_offset)
+        for bucket in range(n_buckets):
+            icon_offset = u32(hash_offset + 4 + 4 * bucket)
+            while icon_offset != 0xFFFFFFFF:
+                name = string(u32(icon_offset + 4))
+                images = u32(icon_offset + 8)
+                for i in range(u32(images)):
+                    image = images + 4 + 8 * i
+                    sub, flags = directories[u16(image)], u16(image + 2)
+                    for flag, ext in self.CACHE_FLAGS:
+                        if flags & flag:
+                            self.add(rank, sizes, sub, name, ext, os.path.join(theme_dir, sub, name + ext))
+                icon_offset = u32(icon_offset)
+
+    def lookup(self, icon_name, size=APP_ICON_SIZE):
+        """Najlepiej pasujący plik dla nazwy ikony (albo ścieżki z Icon=) lub None"""
+        if os.path.isabs(icon_name):
+            return icon_name if os.path.isfile(icon_name) else None
+        stem, ext = os.path.splitext(icon_name)
+        if ext in self.EXTENSIONS:
+            icon_name = stem  # Stare pliki .desktop podają Icon=nazwa.png
+        candidates = [c for c in self.icons.get(icon_name, ())
+                      if self.svg_supported or not c[3].endswith('.svg')]
+        if not candidates:
+            return self.pixmaps.get(icon_name)
+
+        def score(candidate):
+            rank, icon_size, scalable, path = candidate
+            if icon_size == size and not scalable:
+                fit = 0
+            elif scalable:
+                fit = 1
+            elif icon_size > size:
+                fit = 2 + icon_size - size  # Lepiej zmniejszać niż powiększać
+            else:
+                fit = 1000 + size - icon_size
+            return rank, fit
+        return min(candidates, key=score)[3]
+
+
+class PhotoImageCache:
+    """Ograniczony (LRU) cache obiektów PhotoImage, żeby nie dekodować tej samej ikony drugi raz"""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.items = OrderedDict()
+
+    def get(self, key, factory):
+        if key in self.items:
+            self.items.move_to_end(key)
+            return self.items[key]
+        try:
+            value = factory()
+        except Exception as e:
+            apps_log.warning("Error loading icon %s: %s", key[0], e)
+            value = None  # Zapamiętaj też błąd, żeby nie próbować przy każdym przewinięciu
+        self.items[key] = value
+        if len(self.items) > self.maxsize:
+            self.items.popitem(last=False)
+        return value
+
+
+# --- Biblioteka multimediów (Media library) ---
+
+def is_under(path, directory):
+    """Czy path to directory albo leży pod nim (obie ścieżki znormalizowane)"""
+    return path == directory or path.startswith(directory.rstrip(os.sep) + os.sep)
+
+
+class DaemonThreadPool:
+    """Minimalna pula na wątkach daemon - zawieszony stat()/scandir() na martwym NFS nie blokuje wyjścia
+
+    ThreadPoolExecutor dołącza swoje wątki przy zamykaniu interpretera, więc wątek
+    czekający na niedostępny zasób wstrzymałby zamknięcie launchera na zawsze.
+    """
+
+    def __init__(self, max_workers, thread_name_prefix='pool'):
+        self.tasks = queue.Queue()
+        for i in range(max_workers):
+            threading.Thread(target=self._worker, name=f"{thread_name_prefix}_{i}", daemon=True).start()
+        self.max_workers = max_workers
+
+    def _worker(self):
+        while True:
+            task = self.tasks.get()
+            if task is None:
+                return
+            future, func, args = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def submit(self, func, *args):
+        future = Future()
+        self.tasks.put((future, func, args))
+        return future
+
+    def shutdown(self, cancel_futures=False):
+        """Kończy wątki po bieżących zadaniach (nie czeka na nie); cancel_futures odrzuca kolejkę"""
+        if cancel_futures:
+            while True:
+                try:
+                    task = self.tasks.get_nowait()
+                except queue.Empty:
+                    break
+                if task is not None:
+                    task[0].cancel()
+        for _ in range(self.max_workers):
+            self.tasks.put(None)
+
+
+# Wynik odwiedzenia jednego katalogu przez ParallelWalker
+# duplicate - katalog jest już w bibliotece pod inną (kanoniczną) ścieżką i trzeba usunąć jego wpisy
+DirListing = namedtuple('DirListing', 'path mtime listed files subdirs error duplicate', defaults=(False,))
+
+
+class ParallelWalker:
+    """Równoległe przechodzenie drzewa przez os.scandir - na NFS/SMB czekamy na wiele katalogów naraz
+
+    Liczba jednoczesnych listowań jest ograniczona osobno dla każdego montowania (st_dev),
+    pętle dowiązań wykrywa para (st_dev, st_ino), a z kilku ścieżek do tego samego
+    katalogu wygrywa zawsze ta sama (canonical_rank). Katalog, który nie odpowie
+    w dir_timeout sekund, jest zgłaszany jako błąd i pomijany.
+    """
+
+    def __init__(self, extensions=VIDEO_EXTENSIONS, workers_per_mount=8, max_workers=16,
+                 dir_timeout=30.0, follow_symlinks=True, scandir=os.scandir, stat=os.stat):
+        self.extensions = extensions
+        self.workers_per_mount = workers_per_mount
+        self.max_workers = max_workers
+        self.dir_timeout = dir_timeout
+        self.follow_symlinks = follow_symlinks
+        self.scandir = scandir
+        self.stat = stat
+        self.mount_slots = {}
+        self.lock = threading.Lock()
+
+    def mount_slot(self, dev):
+        with self.lock:
+            if dev not in self.mount_slots:
+                self.mount_slots[dev] = threading.BoundedSemaphore(self.workers_per_mount)
+            return self.mount_slots[dev]
+
+    def list_directory(self, path, known_mtime, started, real_root=None):
+        """Wątek roboczy: stat katalogu i - jeśli mtime się zmienił - jego listing
+
+        Dowiązania do katalogów leżących w real_root są pomijane - ich zawartość
+        i tak trafi do biblioteki pod prawdziwą ścieżką.
+        """
+        started[path] = time.monotonic()
+        st = self.stat(path)
+        key = (st.st_dev, st.st_ino)
+        if st.st_mtime_ns == known_mtime:
+            return key, DirListing(path, st.st_mtime_ns, False, [], [], None)
+
+        files = []
+        subdirs = []
+        with self.mount_slot(st.st_dev), self.scandir(path) as it:
+            for entry in it:
+                try:
+                    # is_dir() korzysta z d_type, więc dla zwykłych wpisów nie robi stat()
+                    if entry.is_dir(follow_symlinks=self.follow_symlinks):
+                        if real_root and entry.is_symlink() and is_under(os.path.realpath(entry.path), real_root):
+                            continue
+                        subdirs.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in self.extensions:
+                        est = entry.stat()
+                        files.append((entry.path, entry.name, est.st_size, est.st_mtime_ns))
+                except OSError:
+                    continue
+        return key, DirListing(path, st.st_mtime_ns, True, files, subdirs, None)
+
+    @staticmethod
+    def canonical_rank(path, root, real_root):
+        """Klucz wyboru ścieżki do katalogu: najpierw bez dowiązań między root a nim, potem alfabetycznie"""
+        if real_root is None:
+            return False, path
+        expected = os.path.normpath(os.path.join(real_root, os.path.relpath(path, root)))
+        return os.path.realpath(path) != expected, path
+
+    def walk(self, root, known_mtimes=None, known_children=None, cancel=None):
+        """Generator DirListing dla root i podkatalogów, w kolejności ukończenia
+
+        Katalogi z niezmienionym mtime (known_mtimes) nie są listowane - ich
+        podkatalogi bierzemy z known_children. Ustawienie zdarzenia cancel
+        kończy generator przy najbliższym obiegu pętli.
+        """
+        known_mtimes = known_mtimes or {}
+        known_children = known_children or {}
+        real_root = os.path.realpath(root) if self.follow_symlinks else None
+        visited = {}  # (st_dev, st_ino) -> ścieżka, pod którą katalog jest w bibliotece
+        started = {}
+        pending = {}
+        pool = DaemonThreadPool(max_workers=self.max_workers, thread_name_prefix='media-walk')
+
+        def submit(path):
+            pending[pool.submit(self.list_directory, path, known_mtimes.get(path), started, real_root)] = path
+
+        submit(root)
+        try:
+            while pending:
+                if cancel is not None and cancel.is_set():
+                    return
+                done, _ = wait(pending, timeout=min(1.0, self.dir_timeout), return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    try:
+                        key, listing = future.result()
+                    except OSError as e:
+                        yield DirListing(path, None, False, [], [], e)
+                        continue
+                    if key in visited:
+                        # Pętla dowiązań albo ten sam katalog pod inną ścieżką - zostaje jedna,
+                        # niezależnie od tego, która skończyła się pierwsza
+                        other = visited[key]
+                        if self.canonical_rank(other, root, real_root) <= self.canonical_rank(path, root, real_root):
+                            yield DirListing(path, None, False, [], [], None, True)
+                            continue
+                        yield DirListing(other, None, False, [], [], None, True)
+                    visited[key] = path
+                    yield listing
+                    for child in listing.subdirs if listing.listed else known_children.get(path, ()):
+                        submit(child)
+
+                now = time.monotonic()
+                for future, path in list(pending.items()):
+                    if not future.done() and now - started.get(path, now) > self.dir_timeout:
+                        del pending[future]
+                        yield DirListing(path, None, False, [], [],
+                                         TimeoutError(f"no response after {self.dir_timeout:g}s"))
+        finally:
+            # Zawieszony wątek (np. martwy NFS) nie blokuje ani końca skanu, ani wyjścia z programu
+            pool.shutdown(cancel_futures=True)
+
+
+class ScanProgress:
+    """Stan zadania skanowania w tle - liczniki dla paska postępu i flaga anulowania
+
+    Liczniki zapisuje tylko wątek skanu, wątek UI je odczytuje.
+    """
+
+    def __init__(self):
+        self.cancelled = threading.Event()
+        self.started = time.monotonic()
+        self.dirs = 0
+        self.files = 0
+
+    def cancel(self):
+        self.cancelled.set()
+
+    @property
+    def is_cancelled(self):
+        return self.cancelled.is_set()
+
+    def rate(self):
+        """Pliki na sekundę od początku skanu"""
+        elapsed = time.monotonic() - self.started
+        return self.files / elapsed if elapsed > 0 else 0.0
+
+
+class MediaProber:
+    """Metadane filmów z ffprobe (czas trwania, rozdzielczość, kodeki), kilka plików naraz"""
+    FIELDS = ('duration', 'width', 'height', 'video_codec', 'audio_codec')
+
+    def __init__(self, workers=4, timeout=30, ffprobe=None):
+        self.workers = workers
+        self.timeout = timeout
+        self.ffprobe = ffprobe or shutil.which('ffprobe')
+
+    @property
+    def available(self):
+        return self.ffprobe is not None
+
+    def probe_file(self, path):
+        """Słownik FIELDS dla jednego pliku; pusty, jeśli ffprobe go nie rozpoznał"""
+        result = subprocess.run(
+            [self.ffprobe, '-v', 'error', '-print_format', 'json',
+             '-show_entries', 'format=duration:stream=codec_type,codec_name,width,height', path],
+            stdin=subprocess.DEVNULL, capture_output=True, timeout=self.timeout
+        )
+        if result.returncode != 0:
+            return {}
+        data = json.loads(result.stdout or b'{}')
+        info = {}
+        try:
+            info['duration'] = float(data.get('format', {}).get('duration'))
+        except (TypeError, ValueError):
+            pass
+        for stream in data.get('streams', []):
+            if stream.get('codec_type') == 'video' and 'video_codec' not in info:
+                info['video_codec'] = stream.get('codec_name')
+                info['width'] = stream.get('width')
+                info['height'] = stream.get('height')
+            elif stream.get('codec_type') == 'audio' and 'audio_codec' not in info:
+                info['audio_codec'] = stream.get('codec_name')
+        return info
+
+    def run(self, items, cancel=None):
+        """Generator (element, metadane) dla (ścieżka, ...) z items, w kolejności ukończenia
+
+        Pliki, których nie udało się zbadać (np. przekroczony czas), mają metadane None.
+        """
+        items = iter(items)
+        pending = {}
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='media-probe')
+
+        def fill():
+            # Nie więcej niż dwa zadania na wątek - reszta czeka w iteratorze
+            while len(pending) < self.workers * 2:
+                item = next(items, None)
+                if item is None:
+                    break
+                pending[pool.submit(self.probe_file, item[0])] = item
+
+        fill()
+        try:
+            while pending:
+                if cancel is not None and cancel.is_set():
+                    return
+                done, _ = wait(pending, timeout=1.0, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    try:
+                        info = future.result()
+                    except (OSError, ValueError, subprocess.SubprocessError) as e:
+                        scan_log.warning("Error probing %s: %s", item[0], e)
+                        info = None
+                    yield item, info
+                fill()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+class MediaEntry:
+    """Film w bibliotece - rekord ze __slots__ zamiast słownika
+
+    Katalog jest internowany (jeden obiekt na folder), a pełną ścieżkę i nazwę
+    bez rozszerzenia składamy dopiero dla widocznych kafelków i odtwarzania.
+    """
+    __slots__ = ('directory', 'filename', 'sort_key', 'size', 'mtime',
+                 'duration', 'width', 'height', 'video_codec', 'audio_codec')
+
+    def __init__(self, directory, filename, size=None, mtime=None, duration=None, width=None, height=None,
+                 video_codec=None, audio_codec=None, key=None):
+        self.directory = sys.intern(directory)
+        self.filename = filename
+        # key - gotowy klucz sortowania (np. z migawki), żeby nie liczyć kolacji ponownie
+        self.sort_key = key if key is not None else sort_key(os.path.splitext(filename)[0])
+        self.size = size
+        self.mtime = mtime
+        self.duration = duration
+        self.width = width
+        self.height = height
+        self.video_codec = video_codec
+        self.audio_codec = audio_codec
+
+    @property
+    def path(self):
+        return os.path.join(self.directory, self.filename)
+
+    @property
+    def name(self):
+        return os.path.splitext(self.filename)[0]
+
+
+class PlaceholderEntry:
+    """Kafelek informacyjny (np. "brak filmów") wyświetlany zamiast pustej biblioteki"""
+    __slots__ = ('name', 'sort_key')
+    path = ''
+    size = mtime = duration = width = height = video_codec = audio_codec = None
+
+    def __init__(self, name):
+        self.name = name
+        self.sort_key = sort_key(name)
+
+
+class MediaSnapshot(Sequence):
+    """Posortowana biblioteka w pliku mapowanym w pamięć - MediaEntry powstaje dopiero przy odczycie
+
+    Układ pliku: nagłówek, rekordy stałej szerokości w kolejności sort_key, tablica
+    napisów UTF-8. Otwarcie czyta tylko nagłówek, więc nie zależy od wielkości biblioteki.
+    Napisy są adresowane (przesunięcie, długość) od początku tablicy, powtarzające się
+    (katalogi, kodeki) zapisujemy raz.
+    """
+    MAGIC = b'TVMEDIA\0'
+    VERSION = 1
+    # magic, wersja, liczba rekordów, początek tablicy napisów, katalog główny, kolacja
+    HEADER = struct.Struct('<8sIIQIIII')
+    # katalog, plik, klucz sortowania, kodek wideo, kodek audio, size, mtime, duration, width, height
+    RECORD = struct.Struct('<IIIIIIIIIIqqdii')
+
+    def __init__(self, path, root=None):
+        """Otwiera migawkę; ValueError, jeśli plik jest uszkodzony, w innej wersji albo nie pasuje"""
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self.map) < self.HEADER.size:
+                raise ValueError("truncated header")
+            magic, version, self.count, self.strings, *refs = self.HEADER.unpack_from(self.map)
+            if magic != self.MAGIC or version != self.VERSION:
+                raise ValueError(f"unsupported snapshot version {version}")
+            if self.strings != self.HEADER.size + self.count * self.RECORD.size or self.strings > len(self.map):
+                raise ValueError("truncated records")
+            self.root = self.string(*refs[0:2])
+            # Klucze zapisane przy innej kolacji dałyby inną kolejność niż sort_key()
+            if self.string(*refs[2:4]) != (collation_name or ''):
+                raise ValueError("snapshot was sorted with a different collation")
+            if root is not None and self.root != root:
+                raise ValueError(f"snapshot is for {self.root}")
+        except Exception:
+            self.map.close()
+            raise
+        # Zmaterializowane wpisy - zmiany z ffprobe (setattr) muszą przetrwać kolejny odczyt
+        self.entries = {}
+
+    def string(self, offset, length):
+        start = self.strings + offset
+        if start + length > len(self.map):
+            raise ValueError("string outside of snapshot")
+        return self.map[start:start + length].decode('utf-8', 'surrogatepass')
+
+    def __len__(self):
+        return self.count
+
+    def entry(self, index):
+        (dir_off, dir_len, file_off, file_len, key_off, key_len, video_off, video_len, audio_off, audio_len,
+         size, mtime, duration, width, height) = self.RECORD.unpack_from(
+            self.map, self.HEADER.size + index * self.RECORD.size)
+        return MediaEntry(
+            self.string(dir_off, dir_len), self.string(file_off, file_len),
+            None if size < 0 else size, None if mtime < 0 else mtime,
+            None if math.isnan(duration) else duration,
+            None if width < 0 else width, None if height < 0 else height,
+            self.string(video_off, video_len) or None, self.string(audio_off, audio_len) or None,
+            key=self.string(key_off, key_len)
+        )
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("snapshot index out of range")
+        entry = self.entries.get(index)
+        if entry is None:
+            entry = self.entries[index] = self.entry(index)
+        return entry
+
+    def __iter__(self):
+        # Pełne przejście (np. zamiana na listę) nie zapełnia pamięci podręcznej wpisów
+        for index in range(self.count):
+            yield self.entries.get(index) or self.entry(index)
+
+    def close(self):
+        self.map.close()
+
+    @classmethod
+    def write(cls, path, root, media_files):
+        """Zapisuje posortowaną listę MediaEntry atomowo (plik tymczasowy + rename)"""
+        strings = bytearray()
+        offsets = {}
+
+        def ref(text):
+            if text not in offsets:
+                data = (text or '').encode('utf-8', 'surrogatepass')
+                offsets[text] = (len(strings), len(data))
+                strings.extend(data)
+            return offsets[text]
+
+        root_ref = ref(root)
+        collation_ref = ref(collation_name or '')
+        records = bytearray(cls.RECORD.size * len(media_files))
+        for i, media in enumerate(media_files):
+            cls.RECORD.pack_into(
+                records, i * cls.RECORD.size,
+                *ref(media.directory), *ref(media.filename), *ref(media.sort_key),
+                *ref(media.video_codec), *ref(media.audio_codec),
+                media.size if media.size is not None else -1,
+                media.mtime if media.mtime is not None else -1,
+                media.duration if media.duration is not None else math.nan,
+                media.width if media.width is not None else -1,
+                media.height if media.height is not None else -1
+            )
+        if len(strings) > 0xFFFFFFFF:
+            raise ValueError("snapshot string table exceeds 4 GiB")
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(media_files), cls.HEADER.size + len(records),
+                                    *root_ref, *collation_ref))
+            f.write(records)
+            f.write(strings)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+
+class MediaOverlay(Sequence):
+    """Migawka plus mała posortowana lista nowych plików ze skanu, scalane przy odczycie
+
+    Pozycje nowych wpisów w migawce są liczone bisectem raz, przy dodaniu, więc
+    ani dodanie partii, ani odczyt nie przechodzą po całej bibliotece.
+    """
+
+    def __init__(self, base, extra, base_positions):
+        self.base = base
+        self.extra = extra  # posortowane po sort_key
+        # Indeks w połączonej liście dla każdego wpisu z extra (rosnąco)
+        self.merged = [position + k for k, position in enumerate(base_positions)]
+        self.base_positions = base_positions
+
+    @classmethod
+    def extend(cls, media_files, batch):
+        """Nowa nakładka: media_files (migawka albo nakładka) z dołożoną partią batch"""
+        if isinstance(media_files, cls):
+            base, pairs = media_files.base, list(zip(media_files.extra, media_files.base_positions))
+        else:
+            base, pairs = media_files, []
+        pairs += [(media, bisect.bisect_left(base, media.sort_key, key=lambda x: x.sort_key)) for media in batch]
+        # Dwie posortowane serie - Timsort scala je w czasie liniowym
+        pairs.sort(key=lambda pair: pair[0].sort_key)
+        return cls(base, [media for media, _ in pairs], [position for _, position in pairs])
+
+    def __len__(self):
+        return len(self.base) + len(self.extra)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("media index out of range")
+        k = bisect.bisect_right(self.merged, index)  # Ile nowych wpisów jest na pozycjach <= index
+        if k and self.merged[k - 1] == index:
+            return self.extra[k - 1]
+        return self.base[index - k]
+
+
+class MediaLibrary:
+    """Trwały indeks plików wideo w SQLite; ponowny skan listuje tylko katalogi ze zmienionym mtime"""
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS dirs (
+            path TEXT PRIMARY KEY,
+            parent TEXT,
+            mtime INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS files (
+            path TEXT PRIMARY KEY,
+            dir TEXT NOT NULL,
+            name TEXT NOT NULL,
+            size INTEGER,
+            mtime INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS probes (
+            path TEXT PRIMARY KEY,
+            size INTEGER,
+            mtime INTEGER,
+            duration REAL,
+            width INTEGER,
+            height INTEGER,
+            video_codec TEXT,
+            audio_codec TEXT
+        );
+        CREATE INDEX IF NOT EXISTS dirs_parent ON dirs(parent);
+        CREATE INDEX IF NOT EXISTS files_dir ON files(dir);
+    """
+
+    # Co ile sekund skan oddaje kolejną partię znalezionych plików
+    BATCH_INTERVAL = 0.25
+    # Wynik ffprobe jest aktualny tylko dla tego samego rozmiaru i mtime pliku
+    PROBE_JOIN = "probes p ON p.path = f.path AND p.size IS f.size AND p.mtime IS f.mtime"
+
+    def __init__(self, path=MEDIA_DB_FILE, snapshot_path=MEDIA_SNAPSHOT_FILE):
+        self.path = path
+        self.snapshot_path = snapshot_path
+
+    def connect(self):
+        # Osobne połączenie na każdą operację - biblioteka jest używana z wątków roboczych
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.executescript(self.SCHEMA)
+        return conn
+
+    @staticmethod
+    def under(column):
+        """Warunek SQL: kolumna to katalog ? albo leży pod nim (bez LIKE, bo nazwy mogą mieć % i _)"""
+        return f"({column} = ? OR substr({column}, 1, length(?) + 1) = ? || '/')"
+
+    def load(self, root):
+        """Ostatnio zapisana zawartość katalogu root - bez dotykania dysku z filmami"""
+        root = os.path.normpath(root)
+        with contextlib.closing(self.connect()) as conn:
+            rows = conn.execute(
+                f"SELECT f.dir, f.name, f.size, f.mtime, p.duration, p.width, p.height, p.video_codec, p.audio_codec "
+                f"FROM files f LEFT JOIN {self.PROBE_JOIN} WHERE {self.under('f.dir')}", (root, root, root)
+            ).fetchall()
+        media_files = [MediaEntry(*row) for row in rows]
+        media_files.sort(key=lambda x: x.sort_key)
+        return media_files
+
+    def open_snapshot(self, root):
+        """Migawka ostatniego skanu root (MediaSnapshot) albo None, jeśli jej nie ma lub jest nieaktualna"""
+        try:
+            return MediaSnapshot(self.snapshot_path, os.path.normpath(root))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, struct.error) as e:
+            scan_log.info("Ignoring media snapshot %s: %s", self.snapshot_path, e)
+            return None
+
+    def save_snapshot(self, root, media_files):
+        """Zapisuje migawkę posortowanej biblioteki i zwraca ją otwartą (przy błędzie - media_files)"""
+        root = os.path.normpath(root)
+        try:
+            MediaSnapshot.write(self.snapshot_path, root, media_files)
+            return MediaSnapshot(self.snapshot_path, root)
+        except (OSError, ValueError, struct.error) as e:
+            scan_log.error("Error writing media snapshot: %s", e)
+            return media_files
+
+    def probe(self, root, prober=None, cancel=None):
+        """Generator: bada ffprobe nowe i zmienione pliki pod root i oddaje partiami {ścieżka: metadane}
+
+        Wyniki są zapisywane od razu, więc kolejne starty nie badają niezmienionych plików.
+        """
+        root = os.path.normpath(root)
+        prober = prober or MediaProber()
+        if not prober.available:
+            return
+        with contextlib.closing(self.connect()) as conn:
+            todo = conn.execute(
+                f"SELECT f.path, f.size, f.mtime FROM files f LEFT JOIN {self.PROBE_JOIN} "
+                f"WHERE {self.under('f.dir')} AND p.path IS NULL", (root, root, root)
+            ).fetchall()
+            if not todo:
+                return
+            scan_log.info("Probing %d new or changed files in %s", len(todo), root)
+            batch = {}
+            last_batch = time.monotonic()
+            for (path, size, mtime), info in prober.run(todo, cancel):
+                if info is None:
+                    continue  # Spróbujemy przy następnym starcie
+                conn.execute("INSERT OR REPLACE INTO probes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                             (path, size, mtime, *(info.get(field) for field in MediaProber.FIELDS)))
+                batch[path] = {field: info.get(field) for field in MediaProber.FIELDS}
+                if time.monotonic() - last_batch >= self.BATCH_INTERVAL * 4:
+                    conn.commit()
+                    yield batch
+                    batch = {}
+                    last_batch = time.monotonic()
+            conn.commit()
+            if batch:
+                yield batch
+
+    def files_in(self, directory):
+        """Ścieżki filmów zapisanych w indeksie dla jednego katalogu (bez podkatalogów)"""
+        with contextlib.closing(self.connect()) as conn:
+            return [row[0] for row in conn.execute("SELECT path FROM files WHERE dir = ?", (directory,))]
+
+    def remove_tree(self, conn, directory):
+        args = (directory, directory, directory)
+        conn.execute(f"DELETE FROM files WHERE {self.under('dir')}", args)
+        conn.execute(f"DELETE FROM dirs WHERE {self.under('path')}", args)
+
+    def rescan(self, root, walker=None):
+        """Aktualizuje indeks dla root i zwraca posortowaną listę filmów"""
+        for _ in self.scan(root, walker):
+            pass
+        return self.load(root)
+
+    def scan(self, root, walker=None, progress=None):
+        """Generator: aktualizuje indeks dla root i oddaje partiami nowo znalezione filmy
+
+        Każdy znany katalog jest tylko stat-owany; listowane są wyłącznie katalogi,
+        których mtime się zmienił (dodano, usunięto lub przemianowano wpis).
+        Pierwsza partia wychodzi od razu, kolejne co BATCH_INTERVAL sekund; w tym samym
+        rytmie zatwierdzamy transakcję, żeby nie trzymać blokady zapisu przez cały skan.
+        Przerwany skan (progress.cancel()) zapisuje katalogi już przetworzone -
+        reszta zostanie wylistowana przy następnym skanie.
+        """
+        root = os.path.normpath(root)
+        walker = walker or ParallelWalker()
+        progress = progress or ScanProgress()
+        with contextlib.closing(self.connect()) as conn, conn:
+            known = {}
+            children = {}
+            for path, parent, mtime in conn.execute(
+                    f"SELECT path, parent, mtime FROM dirs WHERE {self.under('path')}", (root, root, root)):
+                known[path] = mtime
+                children.setdefault(parent, []).append(path)
+            # Liczba plików w katalogach, których nie trzeba listować - do licznika postępu
+            known_files = dict(conn.execute(
+                f"SELECT dir, count(*) FROM files WHERE {self.under('dir')} GROUP BY dir", (root, root, root)))
+
+            batch = []
+            last_batch = 0.0
+            last_commit = started = time.monotonic()
+            stats = {'dirs': 0, 'listed': 0, 'errors': 0, 'new': 0}
+            # Sprawdzane raz - wywołanie log.debug dla każdego pliku też kosztuje
+            debug = scan_log.isEnabledFor(logging.DEBUG)
+            for listing in walker.walk(root, known, children, progress.cancelled):
+                if time.monotonic() - last_commit >= self.BATCH_INTERVAL:
+                    # Krótkie transakcje - odczyty (np. kolejka odtwarzania) nie czekają na koniec skanu
+                    conn.commit()
+                    last_commit = time.monotonic()
+                if batch and time.monotonic() - last_batch >= self.BATCH_INTERVAL:
+                    yield batch
+                    batch = []
+                    last_batch = time.monotonic()
+                directory = listing.path
+                if listing.duplicate:
+                    # Ta sama zawartość jest w bibliotece pod kanoniczną ścieżką
+                    self.remove_tree(conn, directory)
+                    continue
+                if listing.error:
+                    if isinstance(listing.error, FileNotFoundError):
+                        self.remove_tree(conn, directory)
+                    else:
+                        # Np. przekroczony czas na zasobie sieciowym - zostaw poprzednie dane
+                        scan_log.warning("Error scanning directory %s: %s", directory, listing.error)
+                        stats['errors'] += 1
+                    continue
+                stats['dirs'] += 1
+                progress.dirs += 1
+                if not listing.listed:
+                    progress.files += known_files.get(directory, 0)
+                    continue
+                stats['listed'] += 1
+                progress.files += len(listing.files)
+
+                files = [(path, directory, name, size, mtime) for path, name, size, mtime in listing.files]
+                old_files = {row[0] for row in conn.execute("SELECT path FROM files WHERE dir = ?", (directory,))}
+                new_paths = {f[0] for f in files}
+                conn.executemany("DELETE FROM files WHERE path = ?", [(p,) for p in old_files - new_paths])
+                conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)", files)
+                for path, _, name, size, mtime in files:
+                    if path not in old_files:
+                        if debug:
+                            scan_log.debug("Found video: %s", path)
+                        batch.append(MediaEntry(directory, name, size, mtime))
+                        stats['new'] += 1
+
+                for gone in set(children.get(directory, [])) - set(listing.subdirs):
+                    self.remove_tree(conn, gone)
+                # Nowe podkatalogi dostają mtime NULL, więc zostaną wylistowane
+                conn.executemany("INSERT OR IGNORE INTO dirs VALUES (?, ?, NULL)",
+                                 [(d, directory) for d in listing.subdirs])
+                conn.execute("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?)",
+                             (directory, os.path.dirname(directory) if directory != root else None, listing.mtime))
+            if progress.is_cancelled:
+                scan_log.info("Scan of %s cancelled after %d directories, %d files in %.2fs",
+                              root, progress.dirs, progress.files, time.monotonic() - started)
+                return
+            if batch:
+                yield batch
+
+            conn.execute("DELETE FROM probes WHERE path NOT IN (SELECT path FROM files)")
+            count, total_bytes = conn.execute(
+                f"SELECT count(*), coalesce(sum(size), 0) FROM files WHERE {self.under('dir')}", (root, root, root)
+            ).fetchone()
+            scan_log.info(
+                "Scanned %s: %d files (%d new), %.1f GB, %d directories (%d listed, %d errors) in %.2fs",
+                root, count, stats['new'], total_bytes / 1e9, stats['dirs'], stats['listed'],
+                stats['errors'], time.monotonic() - started
+            )
+
+
+# --- Miniatury filmów (Video thumbnails) ---
+
+# Okładki obok filmów, sprawdzane przed wyciąganiem klatki przez ffmpeg
+SIDECAR_NAMES = ('poster', 'folder', 'cover')
+SIDECAR_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+# Sekunda filmu, z której bierzemy klatkę (krótsze filmy - od początku)
+POSTER_SEEK = 10
+FFMPEG_TIMEOUT = 30
+
+
+def find_sidecar(path):
+    """Okładka filmu: <nazwa>.jpg, <nazwa>-poster.jpg, potem poster/folder/cover.jpg w katalogu"""
+    stem = os.path.splitext(path)[0]
+    directory = os.path.dirname(path)
+    candidates = [stem + suffix + ext for suffix in ('', '-poster') for ext in SIDECAR_EXTENSIONS]
+    candidates += [os.path.join(directory, name + ext) for name in SIDECAR_NAMES for ext in SIDECAR_EXTENSIONS]
+    for candidate in candidates:
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def thumbnail_path(media, cache_dir=THUMBNAIL_DIR):
+    """Plik miniatury w cache - zmiana rozmiaru albo mtime filmu daje nowy klucz"""
+    key = f"{media.path}\0{media.size}\0{media.mtime}"
+    digest = hashlib.sha1(key.encode('utf-8', 'surrogateescape')).hexdigest()
+    return os.path.join(cache_dir, digest[:2], digest + '.png')
+
+
+def make_thumbnail(path, target, size=THUMBNAIL_SIZE, ffmpeg=None, use_pil=True):
+    """Zapisuje miniaturę filmu jako PNG w target (proces roboczy); zwraca target albo None"""
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(suffix='.png', dir=os.path.dirname(target))
+    os.close(fd)
+    try:
+        sidecar = find_sidecar(path) if use_pil else None
+        if sidecar:
+            img = Image.open(sidecar).convert('RGB')
+            img.thumbnail(size, Image.Resampling.LANCZOS)
+            img.save(tmp, 'PNG')
+        elif ffmpeg:
+            video_filter = f"thumbnail,scale={size[0]}:{size[1]}:force_original_aspect_ratio=decrease"
+            for seek in (POSTER_SEEK, 0):
+                result = subprocess.run(
+                    [ffmpeg, '-v', 'error', '-y', '-ss', str(seek), '-i', path,
+                     '-vf', video_filter, '-frames:v', '1', tmp],
+                    stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                    timeout=FFMPEG_TIMEOUT
+                )
+                if result.returncode == 0 and os.path.getsize(tmp) > 0:
+                    break
+            else:
+                return None
+        else:
+            return None
+        os.replace(tmp, target)
+        return target
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+class ThumbnailLoader:
+    """Miniatury filmów: dyskowy cache + pula procesów, widoczne kafelki mają pierwszeństwo
+
+    Metody wywołuje wątek Tk; wyniki z puli wracają przez post (np. post_to_ui).
+    PhotoImage trzymamy tylko dla kafelków na ekranie i na stronach przygotowanych obok.
+    """
+
+    def __init__(self, master, post, on_ready, enabled=True, cache_dir=THUMBNAIL_DIR,
+                 size=THUMBNAIL_SIZE, workers=2):
+        self.master = master
+        self.post = post
+        self.on_ready = on_ready
+        self.cache_dir = cache_dir
+        self.size = size
+        self.workers = workers
+        self.ffmpeg = shutil.which('ffmpeg')
+        self.use_pil = importlib.util.find_spec('PIL') is not None
+        self.enabled = enabled and bool(self.ffmpeg or self.use_pil)
+        self.pool = None  # Tworzona przy pierwszej miniaturze do zrobienia
+        self.known = {}  # plik miniatury -> ścieżka albo None (nie udało się jej zrobić)
+        self.pending = []  # [(film, plik miniatury)] w kolejności priorytetu
+        self.in_flight = set()
+        self.photos = {}
+
+    def request(self, visible, upcoming=()):
+        """Układa kolejkę od nowa: najpierw widoczne filmy, potem następna strona"""
+        if not self.enabled:
+            return
+        pending = []
+        for media in list(visible) + list(upcoming):
+            if not media.path:
+                continue
+            target = thumbnail_path(media, self.cache_dir)
+            if target in self.known or target in self.in_flight:
+                continue
+            if os.path.exists(target):
+                self.known[target] = target
+                continue
+            pending.append((media.path, target))
+        self.pending = pending
+        self.pump()
+
+    def pump(self):
+        # Do puli trafia tylko kilka zadań naraz, reszta czeka tu i może zmienić kolejność
+        while self.pending and len(self.in_flight) < self.workers * 2:
+            path, target = self.pending.pop(0)
+            if target in self.known or target in self.in_flight:
+                continue
+            if self.pool is None:
+                # spawn: proces roboczy nie dziedziczy wątków ani połączenia z X
+                self.pool = lazy_import('concurrent.futures').ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=lazy_import('multiprocessing').get_context('spawn')
+                )
+            self.in_flight.add(target)
+            future = self.pool.submit(make_thumbnail, path, target, self.size, self.ffmpeg, self.use_pil)
+            future.add_done_callback(lambda f, path=path, target=target: self.post(self._finished, path, target, f))
+
+    def _finished(self, path, target, future):
+        self.in_flight.discard(target)
+        try:
+            result = future.result()
+        except Exception as e:
+            scan_log.warning("Error creating thumbnail for %s: %s", path, e)
+            result = None
+        self.known[target] = result
+        self.pump()
+        if result:
+            self.on_ready()
+
+    def photo(self, media):
+        """PhotoImage miniatury albo None, jeśli jeszcze jej nie ma"""
+        if not self.enabled or not media.path:
+            return None
+        target = thumbnail_path(media, self.cache_dir)
+        if not self.known.get(target):
+            return None
+        if target not in self.photos:
+            try:
+                self.photos[target] = tk.PhotoImage(master=self.master, file=target)
+            except tk.TclError as e:
+                scan_log.warning("Error loading thumbnail %s: %s", target, e)
+                self.known[target] = None
+                return None
+        return self.photos[target]
+
+    def retain(self, visible):
+        """Zwalnia PhotoImage kafelków spoza visible (ekran i przygotowane strony)"""
+        keep = {thumbnail_path(media, self.cache_dir) for media in visible if media.path}
+        for target in list(self.photos):
+            if target not in keep:
+                del self.photos[target]
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Szerokość tekstu kafelka w znakach - wszystkie kafelki siatki mają tę samą szerokość
+TILE_TEXT_CHARS = 24
+# Wewnętrzny margines kafelka (padding stylu Dark.TButton) i odstęp między kafelkami (padx/pady)
+TILE_PADDING = 10
+TILE_GAP = 5
+
+
+def tile_size(char_width, line_height, image_size):
+    """(szerokość, wysokość) kafelka w pikselach dla metryk czcionki i obrazka o rozmiarze image_size"""
+    image_width, image_height = image_size
+    width = image_width + char_width * TILE_TEXT_CHARS + 2 * (TILE_PADDING + TILE_GAP)
+    height = max(line_height, image_height) + 2 * (TILE_PADDING + TILE_GAP)
+    return width, height
+
+
+def grid_geometry(width, height, tile):
+    """(kolumny, wiersze) kafelków o rozmiarze tile mieszczących się w width x height px - co najmniej 1x1"""
+    return max(width // tile[0], 1), max(height // tile[1], 1)
+
+
+def page_start(index, visible, total):
+    """Początek strony z elementem index - strony zaczynają się co visible, ostatnia jest dosunięta do końca"""
+    return min(index // visible * visible, max(total - visible, 0))
+
+
+def page_offsets(offset, visible, total):
+    """Początki poprzedniej i następnej strony dla okna od offset (None, gdy takiej nie ma)"""
+    last = max(total - visible, 0)
+    previous = page_start(offset - 1, visible, total) if offset > 0 else None
+    following = page_start(offset + visible, visible, total) if offset < last else None
+    return previous, following
+
+
+# Kolejne znaki wpisane w tym czasie (s) wydłużają prefiks, do którego skaczemy
+TYPEAHEAD_TIMEOUT = 1.0
+
+
+class PrefixIndex:
+    """Pozycje pierwszych elementów o danym prefiksie nazwy w liście posortowanej po sort_key
+
+    Pozycja jest liczona przez bisect (O(log n), także na MediaSnapshot) i zapamiętywana
+    dla prefiksu - indeks odpowiada jednej wersji listy i po jej zmianie budujemy nowy.
+    """
+
+    def __init__(self, items):
+        self.items = items
+        self.positions = {}  # prefiks (małymi literami) -> indeks w items
+
+    def find(self, prefix):
+        """Indeks pierwszego elementu od prefix wzwyż (bez pasującego - najbliższy dalszy) albo None"""
+        if not self.items:
+            return None
+        prefix = prefix.lower()
+        if prefix not in self.positions:
+            # Klucz prefiksu jest mniejszy od kluczy nazw, które się od niego zaczynają
+            i = bisect.bisect_left(self.items, sort_key(prefix), key=lambda x: x.sort_key)
+            self.positions[prefix] = min(i, len(self.items) - 1)
+        return self.positions[prefix]
+
+
+class TilePage:
+    """Jedna strona siatki: ramka ze stałą pulą przycisków - przewijanie zmienia tylko tekst i obraz"""
+
+    def __init__(self, parent, on_activate, columns, width=0):
+        self.frame = ttk.Frame(parent, style='Dark.TFrame')
+        self.on_activate = on_activate
+        self.columns = columns
+        self.width = width
+        self.buttons = []
+        self.items = []      # Element pokazywany w każdym slocie
+        self.contents = []   # (tekst, obraz) ustawione w każdym slocie
+
+    def _create_button(self, slot):
+        # Komenda jest stała dla slotu, więc nie rejestrujemy nowych komend Tcl przy przewijaniu
+        btn = ttk.Button(
+            self.frame,
+            style='Dark.TButton',
+            compound='left',
+            width=self.width,
+            command=lambda: self.on_activate(self.items[slot])
+        )
+        btn.grid(row=slot // self.columns, column=slot % self.columns, padx=5, pady=5, sticky='ew')
+        self.buttons.append(btn)
+        self.contents.append(None)
+        return btn
+
+    def render(self, items, describe):
+        """Pokazuje items w slotach; describe(element) -> (tekst, obraz). Zwraca użyte przyciski"""
+        shown = len(self.items)
+        for slot, item in enumerate(items):
+            btn = self.buttons[slot] if slot < len(self.buttons) else self._create_button(slot)
+            content = describe(item)
+            if self.contents[slot] != content:
+                btn.configure(text=content[0], image=content[1] or '')
+                self.contents[slot] = content
+            if slot >= shown:
+                btn.grid()  # Przywraca slot ukryty przez grid_remove
+        for btn in self.buttons[len(items):shown]:
+            btn.grid_remove()
+        self.items = list(items)
+        return self.buttons[:len(items)]
+
+
+class TileGrid:
+    """Siatka kafelków z zapasowymi stronami przygotowanymi poza ekranem
+
+    preload() wypełnia niewidoczną stronę (np. następną), a render() tych samych
+    elementów tylko ją podmienia z bieżącą - zmiana strony to jedna klatka.
+    width - szerokość tekstu kafelka w znakach (0 - dopasowana do tekstu).
+    """
+
+    def __init__(self, parent, on_activate, columns=4, width=0, spare_pages=2):
+        self.parent = parent
+        self.columns = columns
+        self.pages = [TilePage(parent, on_activate, columns, width) for _ in range(spare_pages + 1)]
+        self.current = self.pages[0]
+        self.current.frame.pack()
+
+    def _find_page(self, items):
+        items = list(items)
+        for page in self.pages:
+            if page is not self.current and page.items == items:
+                return page
+        return None
+
+    def render(self, items, describe):
+        """Pokazuje items; describe(element) -> (tekst, obraz). Zwraca widoczne przyciski"""
+        page = self._find_page(items)
+        if page is not None and items:
+            # Gotowa strona poza ekranem - wystarczy zamienić ramki
+            page.frame.pack()
+            self.current.frame.pack_forget()
+            self.pages.remove(page)
+            self.pages.insert(0, page)
+            self.current = page
+        return self.current.render(items, describe)
+
+    def preload(self, items, describe):
+        """Przygotowuje items na niewidocznej stronie (najdawniej używanej, która ich jeszcze nie ma)"""
+        if not items or self.current.items == list(items):
+            return
+        page = self._find_page(items) or self.pages[-1]
+        page.render(items, describe)
+        # Najświeższe strony na początku - z końca listy bierzemy stronę do nadpisania
+        self.pages.remove(page)
+        self.pages.insert(1, page)
+
+
+# --- Odtwarzanie (Playback) ---
+
+# S01E02, s1e2, S01.E02, 1x02
+EPISODE_PATTERN = re.compile(r'[Ss](\d{1,3})[ ._-]?[Ee](\d{1,4})|\b(\d{1,2})x(\d{2,3})\b')
+# Ile początkowych bajtów następnego pliku z kolejki wczytujemy zawczasu
+PREFETCH_BYTES = 64 << 20
+
+
+def episode_key(name):
+    """(sezon, odcinek) z nazwy pliku albo None"""
+    match = EPISODE_PATTERN.search(name)
+    if not match:
+        return None
+    season, episode = (match.group(1), match.group(2)) if match.group(1) else (match.group(3), match.group(4))
+    return int(season), int(episode)
+
+
+def order_play_queue(paths, order='episode'):
+    """Sortuje pliki folderu: 'episode' - wg SxxEyy (pliki bez numeru na końcu), 'folder' - wg nazwy"""
+    if order == 'episode':
+        def key(path):
+            name = os.path.basename(path)
+            episode = episode_key(name)
+            return (episode is None, episode or (0, 0), sort_key(name))
+    else:
+        def key(path):
+            return sort_key(os.path.basename(path))
+    return sorted(paths, key=key)
+
+
+def path_to_uri(path):
+    # Ścieżka jako URI - spacje i znaki nowej linii nie rozbiją polecenia RC
+    return 'file://' + urllib_parse.quote(os.path.abspath(path))
+
+
+def uri_to_path(uri):
+    return urllib_parse.unquote(urllib_parse.urlparse(uri).path)
+
+
+class Prefetcher:
+    """Rozgrzewa cache stron dla początku następnego pliku z kolejki (jeden wątek naraz)"""
+
+    def __init__(self, nbytes=PREFETCH_BYTES, chunk=1 << 20):
+        self.nbytes = nbytes
+        self.chunk = chunk
+        self.stop = None
+
+    def prefetch(self, path):
+        self.cancel()
+        self.stop = threading.Event()
+        threading.Thread(target=self._warm, args=(path, self.stop), name='prefetch', daemon=True).start()
+
+    def _warm(self, path, stop):
+        started = time.monotonic()
+        done = 0
+        try:
+            with open(path, 'rb', buffering=0) as f:
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(f.fileno(), 0, self.nbytes, os.POSIX_FADV_WILLNEED)
+                # Czytamy i tak - na NFS/SMB podpowiedź bywa ignorowana
+                while done < self.nbytes and not stop.is_set():
+                    data = f.read(min(self.chunk, self.nbytes - done))
+                    if not data:
+                        break
+                    done += len(data)
+        except OSError as e:
+            player_log.warning("Error prefetching %s: %s", path, e)
+            return
+        player_log.debug("Prefetched %.1f MB of %s in %.2fs", done / 1e6, path, time.monotonic() - started)
+
+    def cancel(self):
+        if self.stop is not None:
+            self.stop.set()
+
+
+class VLCRemote:
+    """Proces VLC sterowany przez interfejs oldrc na gnieździe Unix
+
+    Wątek czytający śledzi komunikaty "status change" - pierwszy stan odtwarzania
+    po play() kończy pomiar czasu od naciśnięcia klawisza do startu filmu.
+    """
+    PLAYING = re.compile(rb'play state: 3|state playing')
+    NEW_INPUT = re.compile(rb'new input: (\S+)')
+    CONNECT_TIMEOUT = 10.0
+
+    def __init__(self, args=(), interface='--extraintf', mode='spawn'):
+        self.mode = mode
+        self.socket_dir = tempfile.mkdtemp(prefix='tv-launcher-vlc-')
+        self.socket_path = os.path.join(self.socket_dir, 'rc.sock')
+        self.sock = None
+        self.requested = None  # (czas naciśnięcia, plik) czekające na start odtwarzania
+        self.current = None  # Plik, który VLC właśnie odtwarza (z komunikatu "new input")
+        self.process = subprocess.Popen(
+            ['vlc', interface, 'oldrc', '--rc-unix', self.socket_path, '--rc-fake-tty', *args],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+    @property
+    def alive(self):
+        return self.sock is not None and self.process.poll() is None
+
+    def connect(self):
+        """Czeka, aż VLC otworzy gniazdo RC (wywoływać poza wątkiem Tk)"""
+        deadline = time.monotonic() + self.CONNECT_TIMEOUT
+        while True:
+            if self.process.poll() is not None:
+                raise OSError(f"VLC exited with code {self.process.returncode} before opening its RC socket")
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self.socket_path)
+                break
+            except OSError:
+                sock.close()
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+        self.sock = sock
+        threading.Thread(target=self._read, args=(sock,), name='vlc-rc', daemon=True).start()
+        return self
+
+    def _read(self, sock):
+        with contextlib.suppress(OSError), sock.makefile('rb') as stream:
+            for line in stream:
+                match = self.NEW_INPUT.search(line)
+                if match:
+                    self.current = uri_to_path(match.group(1).decode('utf-8', 'surrogateescape'))
+                requested = self.requested
+                if requested and self.PLAYING.search(line):
+                    self.requested = None
+                    player_log.info("Playback started %.0f ms after keypress (%s mode): %s",
+                                    (time.perf_counter() - requested[0]) * 1000, self.mode, requested[1])
+        if self.sock is sock:
+            self.sock = None
+
+    def expect_playback(self, requested_at, file_path):
+        self.requested = (requested_at, os.path.basename(file_path))
+
+    def send(self, *commands):
+        if self.sock is None:
+            raise OSError("VLC RC socket is not connected")
+        self.sock.sendall(''.join(f"{command}\n" for command in commands).encode('utf-8'))
+
+    def play(self, file_path, requested_at=None, queue=()):
+        """Odtwarza file_path, a po nim kolejne pliki z queue"""
+        self.expect_playback(requested_at or time.perf_counter(), file_path)
+        self.current = None
+        self.send('clear', f"add {path_to_uri(file_path)}", *(f"enqueue {path_to_uri(p)}" for p in queue))
+
+    def stop(self):
+        self.send('stop')
+
+    def seek(self, seconds):
+        self.send(f"seek {int(seconds)}")
+
+    def close(self):
+        with contextlib.suppress(OSError):
+            self.send('quit')
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+        if self.process.poll() is None:
+            self.process.terminate()
+        shutil.rmtree(self.socket_dir, ignore_errors=True)
+
+
+class EmbeddedVLC:
+    """Odtwarzanie przez python-vlc (libvlc) w oknie Tk - bez osobnego procesu i okna VLC"""
+
+    def __init__(self, window_id):
+        vlc = lazy_import('vlc')
+        self.instance = vlc.Instance()
+        if self.instance is None:
+            raise OSError("libvlc could not be initialised")
+        self.player = self.instance.media_player_new()
+        self.player.set_xwindow(window_id)
+        # Lista odtwarzania (kolejka) przechodzi do następnego pliku sama
+        self.list_player = self.instance.media_list_player_new()
+        self.list_player.set_media_player(self.player)
+        self.requested = None  # (czas naciśnięcia, plik) czekające na start odtwarzania
+        # Zdarzenia przychodzą z wątku libvlc - tylko logujemy, bez dotykania Tk
+        self.player.event_manager().event_attach(vlc.EventType.MediaPlayerPlaying, self._on_playing)
+
+    @staticmethod
+    def available():
+        return importlib.util.find_spec('vlc') is not None
+
+    def _on_playing(self, event):
+        requested = self.requested
+        if requested:
+            self.requested = None
+            player_log.info("Playback started %.0f ms after keypress (embedded mode): %s",
+                            (time.perf_counter() - requested[0]) * 1000, requested[1])
+
+    def play(self, file_path, requested_at=None, queue=()):
+        """Odtwarza file_path, a po nim kolejne pliki z queue"""
+        self.requested = (requested_at or time.perf_counter(), os.path.basename(file_path))
+        media_list = self.instance.media_list_new()
+        for path in (file_path, *queue):
+            media_list.add_media(self.instance.media_new_path(path))
+        self.list_player.set_media_list(media_list)
+        self.list_player.play()
+
+    @property
+    def current(self):
+        media = self.player.get_media()
+        return uri_to_path(media.get_mrl()) if media is not None else None
+
+    def next(self):
+        self.list_player.next()
+
+    def previous(self):
+        self.list_player.previous()
+
+    def toggle_pause(self):
+        self.player.pause()
+
+    def seek(self, seconds):
+        self.player.set_time(int(seconds * 1000))
+
+    def seek_by(self, seconds):
+        length = self.player.get_length()
+        position = max(self.player.get_time() + int(seconds * 1000), 0)
+        self.player.set_time(min(position, length) if length > 0 else position)
+
+    def stop(self):
+        self.list_player.stop()
+
+    def close(self):
+        self.list_player.stop()
+        self.list_player.release()
+        self.player.release()
+        self.instance.release()
 
 
 class MediaPlayer:
     # Zmodyfikowano __init__ aby przyjmował funkcję tłumaczenia (tr_func)
-    def __init__(self, root, on_back_callback, tr_func):
+    def __init__(self, root, on_back_callback, tr_func, vlc_remote=None, embedded=False):
         self.root = root
         self.on_back_callback = on_back_callback
         self.tr = tr_func # Przypisanie funkcji tłumaczącej
+        # Ciepły VLC (tryb "warm") - None oznacza nowy proces dla każdego pliku
+        self.vlc_remote = vlc_remote
+        self.embedded = None
+        self.prefetcher = Prefetcher()
         self.setup_ui()
+        if embedded:
+            self.setup_embedded()
 
     def setup_ui(self):
         self.player_window = tk.Toplevel(self.root)
@@ -134,6 +2264,7 @@ class MediaPlayer:
 
         # Bind Escape to leave
         self.player_window.bind('<Escape>', lambda e: self.on_back())
+        self.player_window.bind('<Home>', lambda e: self.seek(0))
 
         # player controls
         self.control_frame = ttk.Frame(self.player_window, style='Dark.TFrame')
@@ -156,40 +2287,130 @@ class MediaPlayer:
         self.status_label.pack(side='left', padx=10, expand=True)
 
         self.current_file = None
+        self.requested_at = None
         self.process = None
+        self.queue = []  # Pliki do odtworzenia, zaczynając od current_file
+        self.now_playing = None
+        self.follow_job = None
+
+    def setup_embedded(self):
+        """Obraz z libvlc w tym oknie; bez python-vlc/libvlc zostaje zewnętrzny proces VLC"""
+        if not EmbeddedVLC.available():
+            player_log.info("python-vlc not installed, playing in a separate VLC window")
+            return
+        self.video_frame = tk.Frame(self.player_window, bg='black')
+        self.video_frame.pack(fill='both', expand=True)
+        self.player_window.update_idletasks()
+        try:
+            self.embedded = EmbeddedVLC(self.video_frame.winfo_id())
+        except Exception as e:
+            player_log.warning("Embedded libVLC unavailable, playing in a separate VLC window: %s", e)
+            self.video_frame.destroy()
+            return
+        # Sterowanie tymi samymi klawiszami co launcher
+        self.player_window.bind('<Return>', lambda e: self.embedded.toggle_pause())
+        self.player_window.bind('<space>', lambda e: self.embedded.toggle_pause())
+        self.player_window.bind('<Left>', lambda e: self.embedded.seek_by(-10))
+        self.player_window.bind('<Right>', lambda e: self.embedded.seek_by(10))
+        self.player_window.bind('<Down>', lambda e: self.embedded.seek_by(-60))
+        self.player_window.bind('<Up>', lambda e: self.embedded.seek_by(60))
+        self.player_window.bind('<Prior>', lambda e: self.embedded.previous())
+        self.player_window.bind('<Next>', lambda e: self.embedded.next())
+        self.player_window.focus_force()
 
     def on_back(self):
         self.stop_playback()
+        self.prefetcher.cancel()
+        if self.embedded is not None:
+            self.embedded.close()
+            self.embedded = None
         self.player_window.destroy()
         self.on_back_callback()
 
-    def open_file(self, file_path):
+    def open_file(self, file_path, requested_at=None, queue=None):
+        """Odtwarza file_path; queue to kolejka zaczynająca się od niego (np. kolejne odcinki)"""
         if file_path:
             self.current_file = file_path
-            filename = os.path.basename(file_path)
-            self.status_label.config(text=f"{self.tr('vlc_playing')} {filename}") # Użycie tłumaczenia
+            self.requested_at = requested_at or time.perf_counter()
+            self.queue = list(queue) if queue else [file_path]
+            self.now_playing = None
+            self.show_now_playing(file_path)
             self.start_playback()
+            if self.follow_job is None:
+                self.follow_job = self.player_window.after(1000, self.follow_queue)
+
+    def show_now_playing(self, file_path):
+        filename = os.path.basename(file_path)
+        self.status_label.config(text=f"{self.tr('vlc_playing')} {filename}") # Użycie tłumaczenia
+
+    def follow_queue(self):
+        """Co sekundę: co gra teraz, i rozgrzanie cache dla następnego pliku z kolejki"""
+        if not self.player_window.winfo_exists():
+            return
+        backend = self.embedded or self.process or self.vlc_remote
+        path = backend.current if backend is not None else None
+        if path and path != self.now_playing:
+            self.now_playing = path
+            self.show_now_playing(path)
+            if path in self.queue:
+                i = self.queue.index(path)
+                if i + 1 < len(self.queue):
+                    self.prefetcher.prefetch(self.queue[i + 1])
+        self.follow_job = self.player_window.after(1000, self.follow_queue)
 
     def start_playback(self):
         if not self.current_file:
             return
 
+        if self.embedded is not None:
+            self.embedded.play(self.current_file, self.requested_at, self.queue[1:])
+            return
+
+        if self.vlc_remote is not None and self.vlc_remote.alive:
+            try:
+                self.vlc_remote.play(self.current_file, self.requested_at, self.queue[1:])
+                return
+            except OSError as e:
+                player_log.warning("Warm VLC not responding, starting a new one: %s", e)
+
         try:
             # Use VLC for playback with fullscreen
-            self.process = subprocess.Popen(
-                ['vlc', '--fullscreen', '--play-and-exit', self.current_file],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
+            # Interfejs RC tylko do pomiaru czasu startu odtwarzania
+            self.process = VLCRemote(['--fullscreen', '--play-and-exit', self.current_file, *self.queue[1:]])
+            self.process.expect_playback(self.requested_at, self.current_file)
+            threading.Thread(target=self.watch_spawned, args=(self.process,), daemon=True).start()
         except FileNotFoundError:
             messagebox.showerror(self.tr('error'), self.tr('vlc_not_found')) # Użycie tłumaczenia
         except Exception as e:
             messagebox.showerror(self.tr('error'), f"{self.tr('could_not_play')} {str(e)}") # Użycie tłumaczenia
 
+    @staticmethod
+    def watch_spawned(remote):
+        try:
+            remote.connect()
+        except OSError as e:
+            player_log.debug("No RC connection to VLC, playback start not measured: %s", e)
+        remote.process.wait()
+        shutil.rmtree(remote.socket_dir, ignore_errors=True)
+
+    def seek(self, seconds):
+        if self.embedded is not None:
+            self.embedded.seek(seconds)
+            return
+        remote = self.process or self.vlc_remote
+        if remote is not None and remote.alive:
+            with contextlib.suppress(OSError):
+                remote.seek(seconds)
+
     def stop_playback(self):
-        if self.process:
-            self.process.terminate()
+        if self.embedded is not None:
+            self.embedded.stop()
+        elif self.process:
+            self.process.close()
             self.process = None
+        elif self.vlc_remote is not None and self.vlc_remote.alive:
+            with contextlib.suppress(OSError):
+                self.vlc_remote.stop()
 
 class StreamingLauncher:
     CONFIG_FILE = os.path.expanduser('~/.streaming_launcher_config.json')
@@ -197,15 +2418,23 @@ class StreamingLauncher:
     GITHUB_LANG_REPO = "Kubixonon/tv-launcher-language"
     LANG_FILE_FORMAT = "lang_%s.json"
 
-    def __init__(self, root):
+    def __init__(self, root, profiler=None):
         self.root = root
+        self.profiler = profiler or StartupProfiler()
         self.selected_section = 0
         self.selected_index = 0
         self.apps_offset = 0
         self.movies_offset = 0
+        # Liczone w setup_ui z rozdzielczości ekranu i metryk czcionki (layout_grids)
         self.visible_apps = 8
         self.visible_movies = 8
+        self.app_columns = self.movie_columns = 4
+        self.preload_job = None  # after_idle przygotowujące sąsiednie strony siatek
+        self.prefix_indexes = {}  # sekcja -> PrefixIndex dla skoku literą
+        self.typeahead = ''
+        self.typeahead_at = 0.0
         self.media_player = None
+        self.vlc_remote = None  # Ciepły VLC (media_settings.vlc_mode = 'warm')
         self.icons = {}
         self.custom_background = None
         self.translations = {} # Słownik na załadowane tłumaczenia
@@ -214,17 +2443,50 @@ class StreamingLauncher:
         self.platform_buttons = []
         self.app_buttons = []
         self.movie_buttons = []
+        self.highlighted = None  # (sekcja, indeks, przycisk) aktualnie podświetlony
+        self.all_apps = []
+        self.icon_theme = None  # Indeks motywu ikon, budowany w tle po wczytaniu aplikacji
+        self.icon_cache = PhotoImageCache()
+        self.media_files = []
+        self.media_library = MediaLibrary()
+        self.media_root = None  # Katalog, z którego pochodzi biblioteka na ekranie
+        # Bieżące zadanie skanowania multimediów (ScanProgress) albo None
+        self.scan_job = None
+        self.probe_job = None
+
+        # Skanowanie aplikacji i multimediów działa w puli wątków,
+        # a wyniki wracają do wątku Tk przez kolejkę
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='tv-launcher')
+        self.ui_queue = queue.Queue()
 
         # Load configuration
-        self.config = self.load_config()
-        self.load_translations() # Nowa metoda ładowania tłumaczeń
+        profile = self.profiler.phase
+        with profile('load_config'):
+            self.config = self.load_config()
+            collation = set_collation_language(self.config.get('language', 'en'))
+            config_log.debug("Sorting names with collation %s", collation or "fallback (no locale)")
+        self.thumbnails = ThumbnailLoader(
+            self.root, self.post_to_ui, self.on_thumbnail_ready,
+            enabled=self.config['media_settings'].get('thumbnails', True)
+        )
+        with profile('load_translations'):
+            self.load_translations() # Nowa metoda ładowania tłumaczeń
         self.check_dependencies
-        self.load_icons()
-        self.setup_ui()
+        with profile('load_icons'):
+            self.load_icons()
+        with profile('setup_ui'):
+            self.setup_ui()
         self.setup_keyboard_controls()
-        self.update_clock()
-        self.load_apps()
-        self.load_media()
+        self.process_ui_queue()
+        with profile('update_clock'):
+            self.update_clock()
+        with profile('load_apps'):
+            self.load_apps()
+        with profile('load_media'):
+            self.load_media()
+        self.root.after_idle(self.profiler.mark_first_paint, self.root)
+        # Ciepły VLC startuje po pierwszym wyrysowaniu, żeby nie spowalniać startu
+        self.root.after_idle(self.start_warm_vlc)
 
     # --- METODY DO OBSŁUGI JĘZYKA ---
 
@@ -258,7 +2520,7 @@ class StreamingLauncher:
                         downloaded_lang = json.load(f)
                         self.translations[lang_code] = downloaded_lang
                 except Exception as e:
-                    print(f"Błąd wczytywania pobranego języka {lang_code}: {e}")
+                    config_log.warning("Błąd wczytywania pobranego języka %s: %s", lang_code, e)
 
     def download_and_load_language(self, lang_code):
         """Pobiera plik językowy z GitHub i zapisuje go lokalnie"""
@@ -376,7 +2638,13 @@ class StreamingLauncher:
             'media_settings': {
                 'video_folder': os.path.expanduser('~/Videos'),
                 'auto_play': True,
-                'default_player': 'vlc'
+                'default_player': 'vlc',
+                'thumbnails': True,
+                # 'warm' - jeden proces VLC czeka w tle, 'spawn' - nowy proces dla każdego pliku,
+                # 'embedded' - libvlc (python-vlc) w oknie odtwarzacza
+                'vlc_mode': 'spawn',
+                # Po filmie: 'episode' - kolejne odcinki (SxxEyy), 'folder' - kolejne pliki wg nazwy, 'off'
+                'play_queue': 'episode'
             }
         }
 
@@ -389,7 +2657,7 @@ class StreamingLauncher:
                     loaded_config['github_repo'] = self.GITHUB_REPO
                     return loaded_config
         except Exception as e:
-            print(f"Error loading config: {e}")
+            config_log.error("Error loading config: %s", e)
 
         return default_config
 
@@ -406,7 +2674,7 @@ class StreamingLauncher:
             with open(self.CONFIG_FILE, 'w') as f:
                 json.dump(self.config, f, indent=4)
         except Exception as e:
-            print(f"Error saving config: {e}")
+            config_log.error("Error saving config: %s", e)
 
     def load_icons(self):
         # Basic icons (in reality, they should be loaded from files)
@@ -428,12 +2696,18 @@ class StreamingLauncher:
 
     def create_icon(self, color, size=32):
         """Creates a simple icon (in reality, should be loaded from files)"""
+        # Rysowane bezpośrednio w Tk, żeby nie ładować PIL przy starcie
         try:
-            from PIL import Image, ImageDraw
-            img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(img)
-            draw.ellipse((0, 0, size-1, size-1), fill=color)
-            return ImageTk.PhotoImage(img)
+            img = tk.PhotoImage(master=self.root, width=size, height=size)
+            radius = size / 2
+            for y in range(size):
+                dy = y + 0.5 - radius
+                half = (radius * radius - dy * dy) ** 0.5
+                x0 = int(round(radius - half))
+                x1 = int(round(radius + half))
+                if x1 > x0:
+                    img.put(color, to=(x0, y, x1, y + 1))
+            return img
         except:
             return None
             
@@ -490,6 +2764,7 @@ class StreamingLauncher:
         self.style.configure('Selected.TButton', background=accent)
         self.style.configure('Accent.TButton', background=accent, foreground='white')
         self.style.configure('Title.TLabel', font=(font_family, 18, 'bold'), foreground=accent)
+        self.layout_grids(font_family, font_size)
 
         # Main container with some transparency for background
         self.main_frame = ttk.Frame(self.root, style='Dark.TFrame')
@@ -554,6 +2829,7 @@ class StreamingLauncher:
 
             self.apps_frame = ttk.Frame(self.apps_container, style='Dark.TFrame')
             self.apps_frame.pack()
+            self.apps_grid = TileGrid(self.apps_frame, self.launch_app, self.app_columns, TILE_TEXT_CHARS)
 
             self.app_buttons = []
 
@@ -574,6 +2850,7 @@ class StreamingLauncher:
 
             self.movies_frame = ttk.Frame(self.movies_container, style='Dark.TFrame')
             self.movies_frame.pack()
+            self.movies_grid = TileGrid(self.movies_frame, self.select_movie, self.movie_columns, TILE_TEXT_CHARS)
 
             self.movie_buttons = []
 
@@ -590,6 +2867,14 @@ class StreamingLauncher:
             )
             self.clock_label.pack(side='left')
 
+        # Postęp skanowania w tle - widoczny tylko w trakcie skanu
+        self.scan_status_label = ttk.Label(
+            self.bottom_frame,
+            font=(font_family, 12),
+            foreground=fg,
+            background=bg
+        )
+
         ttk.Button(
             self.bottom_frame,
             text=self.tr('settings'), # Użycie tłumaczenia
@@ -611,6 +2896,39 @@ class StreamingLauncher:
         self.selected_index = 0
         self.update_selection()
 
+    def layout_grids(self, font_family, font_size):
+        """Dobiera kolumny i wiersze siatek aplikacji i filmów do ekranu i metryk czcionki"""
+        font = tkfont.Font(root=self.root, family=font_family, size=font_size)
+        char_width = font.measure('0')  # Tk liczy szerokość przycisku w znakach '0'
+        line = font.metrics('linespace')
+        title_line = tkfont.Font(root=self.root, family=font_family, size=18, weight='bold').metrics('linespace')
+        platform_line = tkfont.Font(root=self.root, family=font_family, size=14).metrics('linespace')
+        show_apps = self.config['customization'].get('show_apps', True)
+        show_movies = self.config['customization'].get('show_movies', True)
+
+        # Wszystko poza siatkami: marginesy main_frame, dolny pasek, platformy i tytuły sekcji
+        chrome = 2 * 20 + max(line, APP_ICON_SIZE) + 2 * (TILE_PADDING + TILE_GAP)
+        if show_apps:
+            chrome += max(platform_line, APP_ICON_SIZE) + 2 * 10 + 40
+            chrome += title_line + 10 + 40
+        if show_movies:
+            chrome += title_line + 10
+        width = self.root.winfo_screenwidth() - 2 * 50
+        height = max(self.root.winfo_screenheight() - chrome, 0)
+
+        app_tile = tile_size(char_width, line, (APP_ICON_SIZE, APP_ICON_SIZE))
+        movie_tile = tile_size(char_width, line, THUMBNAIL_SIZE)
+        self.app_columns, app_rows = grid_geometry(width, height, app_tile)
+        self.movie_columns, movie_rows = grid_geometry(width, height, movie_tile)
+        if show_apps and show_movies:
+            # Aplikacje dostają około jednej trzeciej wysokości, filmy resztę
+            app_rows = max(app_rows // 3, 1)
+            movie_rows = grid_geometry(width, height - app_rows * app_tile[1], movie_tile)[1]
+        self.visible_apps = self.app_columns * app_rows
+        self.visible_movies = self.movie_columns * movie_rows
+        ui_log.debug("Grid layout: apps %dx%d, movies %dx%d", self.app_columns, app_rows,
+                     self.movie_columns, movie_rows)
+
     def apply_background(self):
         """Apply custom background image or color"""
         bg_image_path = self.config['customization'].get('background_image', '')
@@ -640,7 +2958,7 @@ class StreamingLauncher:
                 self.background_label.lower()  # Move to background
                 
             except Exception as e:
-                print(f"Error loading background image: {e}")
+                config_log.warning("Error loading background image: %s", e)
                 # Fallback to color background
                 self.root.configure(bg=self.config['theme'].get('background', "#747474"))
         else:
@@ -852,13 +3170,12 @@ class StreamingLauncher:
         if folder:
             self.config['media_settings']['video_folder'] = folder
             self.save_config()
-            self.load_media()  # Reload media with new folder
-            messagebox.showinfo(self.tr('success'), f"{self.tr('folder_changed')} {folder}") # Użycie tłumaczenia
+            # Reload media with new folder
+            self.load_media(on_done=lambda: messagebox.showinfo(self.tr('success'), f"{self.tr('folder_changed')} {folder}"), stream=False) # Użycie tłumaczenia
 
     def rescan_media(self):
         """Rescan media files"""
-        self.load_media()
-        messagebox.showinfo(self.tr('success'), self.tr('rescan_complete')) # Użycie tłumaczenia
+        self.load_media(on_done=lambda: messagebox.showinfo(self.tr('success'), self.tr('rescan_complete')), stream=False) # Użycie tłumaczenia
 
 
     def simple_update(self):
@@ -987,192 +3304,585 @@ class StreamingLauncher:
         if messagebox.askyesno(self.tr('shutdown_pc'), self.tr('shutdown_confirm')): # Użycie tłumaczenia
             os.system("systemctl poweroff")
 
-    def load_apps(self):
-        app_dirs = [
-            '/usr/share/applications',
-            os.path.expanduser('~/.local/share/applications')
-        ]
+    # --- PRACA W TLE ---
 
-        self.all_apps = []
-        for app_dir in app_dirs:
-            if os.path.exists(app_dir):
-                for file in os.listdir(app_dir):
-                    if file.endswith('.desktop'):
-                        try:
-                            with open(os.path.join(app_dir, file), 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                if 'NoDisplay=true' not in content and 'Hidden=true' not in content:
-                                    name = None
-                                    exec_line = None
-                                    icon_name = None
-                                    for line in content.split('\n'):
-                                        if line.startswith('Name='):
-                                            name = line.split('=')[1]
-                                        elif line.startswith('Exec='):
-                                            exec_line = line.split('=')[1]
-                                            exec_line = exec_line.split('%')[0].strip()
-                                            if exec_line.startswith('"') and exec_line.endswith('"'):
-                                                exec_line = exec_line[1:-1]
-                                        elif line.startswith('Icon='):
-                                            icon_name = line.split('=')[1]
-
-                                    if name and exec_line:
-                                        self.all_apps.append({
-                                            "name": name,
-                                            "exec": exec_line,
-                                            "file": os.path.join(app_dir, file),
-                                            "icon": self.icons['app']  # Placeholder icon
-                                        })
-                        except Exception as e:
-                            print(f"Error loading {file}: {str(e)}")
-                            continue
+    def run_in_background(self, func, callback, *args):
+        """Uruchamia func w puli wątków, a callback(wynik) wywołuje w wątku Tk"""
+        future = self.executor.submit(func, *args)
+        future.add_done_callback(lambda f: self.post_to_ui(self._finish_background, f, callback))
+        return future
+
+    def post_to_ui(self, func, *args):
+        """Bezpieczne dla Tk przekazanie wywołania z wątku roboczego"""
+        self.ui_queue.put((func, args))
+
+    def process_ui_queue(self):
+        """Wykonuje w wątku Tk wywołania zlecone przez wątki robocze"""
+        while True:
+            try:
+                func, args = self.ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func(*args)
+            except Exception as e:
+                ui_log.exception("Error in UI callback: %s", e)
+        self.root.after(50, self.process_ui_queue)
 
-        self.all_apps.sort(key=lambda x: x["name"])
+    def _finish_background(self, future, callback):
+        try:
+            result = future.result()
+        except Exception as e:
+            ui_log.error("Background task failed: %s", e)
+            return
+        callback(result)
+
+    def load_apps(self):
+        """Uruchamia skanowanie aplikacji w tle"""
+        self.run_in_background(self.scan_apps, self.on_apps_loaded)
+
+    def scan_apps(self):
+        """Wyszukuje pliki .desktop (wywoływane w wątku roboczym)"""
+        started = time.monotonic()
+        bases = application_dirs()
+        index = DesktopEntryIndex(language=self.config.get('language', 'en'))
+        index.load()
+        # Katalogi skanujemy równolegle (osobna pula - ta wywołująca jest zajęta przez nas)
+        with ThreadPoolExecutor(max_workers=max(min(8, len(bases)), 1)) as pool:
+            trees = list(pool.map(index.scan_tree, bases))
+        index.save()
+        self.apps_index = index
+        self.app_bases = bases
+
+        # Pierwszy katalog z danym desktop ID wygrywa (np. nadpisania w ~/.local/share)
+        apps_by_id = {}
+        for tree in trees:
+            for desktop_id, entry in tree:
+                apps_by_id.setdefault(desktop_id, entry)
+
+        all_apps = []
+        for desktop_id, entry in apps_by_id.items():
+            if entry:
+                all_apps.append(AppEntry.from_entry(desktop_id, entry))
+        all_apps.sort(key=lambda x: x.sort_key)
+        apps_log.info("Loaded %d applications from %d directories (%d entries parsed) in %.2fs",
+                      len(all_apps), len(index.dirs), index.parsed, time.monotonic() - started)
+        return all_apps
+
+    def resolve_desktop_id(self, desktop_id):
+        """Aktualny wpis dla desktop ID z uwzględnieniem pierwszeństwa katalogów"""
+        for base in self.app_bases:
+            found, entry = self.apps_index.lookup(base, desktop_id)
+            if found:
+                return AppEntry.from_entry(desktop_id, entry) if entry else None
+        return None
+
+    def on_apps_loaded(self, apps):
+        """Podmienia listę aplikacji po zakończeniu skanowania"""
+        self.all_apps = apps
+        self.apps_offset = 0
+        self.profiler.mark('apps_ready')
+        if hasattr(self, 'apps_frame'):
+            self.update_apps_display()
+            if self.selected_section == 1:
+                self.selected_index = min(self.selected_index, max(len(self.app_buttons) - 1, 0))
+                self.update_selection()
+        self.watch_application_dirs()
+        if self.icon_theme is None:
+            self.run_in_background(lambda: IconThemeIndex().build(), self.on_icon_theme_ready)
+
+    def on_icon_theme_ready(self, icon_theme):
+        """Podmienia zastępcze ikony aplikacji na ikony z motywu"""
+        self.icon_theme = icon_theme
+        self.profiler.mark('icon_theme_ready')
         if hasattr(self, 'apps_frame'):
             self.update_apps_display()
+            self.update_selection()
+
+    def app_icon(self, app):
+        """Ikona aplikacji z motywu (albo zastępcza, dopóki indeks ikon się buduje)"""
+        icon_name = app.icon_name
+        if not icon_name or self.icon_theme is None:
+            return self.icons['app']
+        path = self.icon_theme.lookup(icon_name, APP_ICON_SIZE)
+        if not path:
+            return self.icons['app']
+        photo = self.icon_cache.get(
+            (path, APP_ICON_SIZE),
+            lambda: ImageTk.PhotoImage(load_icon_image(path, APP_ICON_SIZE), master=self.root)
+        )
+        return photo or self.icons['app']
+
+    # --- OBSERWOWANIE KATALOGÓW APLIKACJI ---
+
+    # Zdarzenia z menedżerów pakietów zbieramy przez ten czas przed zastosowaniem
+    APPS_WATCH_DEBOUNCE_MS = 700
 
+    def watch_application_dirs(self):
+        """Włącza inotify na katalogach aplikacji (tylko Linux, po cichu pomija błędy)"""
+        if getattr(self, 'apps_watcher', None):
+            return
+        self.pending_app_changes = set()
+        self.apps_watch_timer = None
+        mask = (InotifyWatcher.IN_CREATE | InotifyWatcher.IN_CLOSE_WRITE | InotifyWatcher.IN_MOVED_TO |
+                InotifyWatcher.IN_MOVED_FROM | InotifyWatcher.IN_DELETE)
+        try:
+            watcher = InotifyWatcher()
+            # Wszystkie zindeksowane katalogi, łącznie z podkatalogami applications
+            for app_dir in self.apps_index.dirs:
+                if any(app_dir == b or app_dir.startswith(b + os.sep) for b in self.app_bases):
+                    watcher.add_watch(app_dir, mask)
+            self.root.tk.createfilehandler(watcher.fileno(), tk.READABLE, self.on_apps_dir_event)
+        except Exception as e:
+            apps_log.info("Application directory watching disabled: %s", e)
+            return
+        self.apps_watcher = watcher
+
+    def on_apps_dir_event(self, fd, mask):
+        """Zbiera zmienione pliki .desktop i odkłada ich zastosowanie (debounce)"""
+        for app_dir, name, event_mask in self.apps_watcher.read_events():
+            if event_mask & InotifyWatcher.IN_Q_OVERFLOW:
+                # Kolejka jądra się przepełniła - sprawdź wszystkie pliki, które znamy i widzimy
+                for known_dir in self.apps_watcher.watches.values():
+                    names = set(self.apps_index.dirs.get(known_dir, {'files': {}})['files'])
+                    with contextlib.suppress(OSError):
+                        names.update(n for n in os.listdir(known_dir) if n.endswith('.desktop'))
+                    self.pending_app_changes.update((known_dir, n) for n in names)
+            elif app_dir and name.endswith('.desktop'):
+                self.pending_app_changes.add((app_dir, name))
+        if self.pending_app_changes:
+            if self.apps_watch_timer:
+                self.root.after_cancel(self.apps_watch_timer)
+            self.apps_watch_timer = self.root.after(self.APPS_WATCH_DEBOUNCE_MS, self.apply_app_changes)
+
+    def apply_app_changes(self):
+        """Nanosi dodane, zmienione i usunięte pliki .desktop na all_apps bez pełnego skanu"""
+        self.apps_watch_timer = None
+        changes, self.pending_app_changes = self.pending_app_changes, set()
+        shown_before = self.all_apps[self.apps_offset:self.apps_offset + self.visible_apps]
+
+        affected_ids = set()
+        for app_dir, name in changes:
+            self.apps_index.update_file(app_dir, name)
+            base = next((b for b in self.app_bases if app_dir == b or app_dir.startswith(b + os.sep)), app_dir)
+            affected_ids.add(desktop_file_id(base, app_dir, name))
+
+        for desktop_id in sorted(affected_ids):
+            for i, app in enumerate(self.all_apps):
+                if app.id == desktop_id:
+                    del self.all_apps[i]
+                    if i < self.apps_offset:
+                        self.apps_offset -= 1  # Zachowaj widoczne kafelki na miejscu
+                    break
+            # Plik mógł zniknąć z katalogu użytkownika i odsłonić wersję systemową
+            entry = self.resolve_desktop_id(desktop_id)
+            if entry:
+                i = bisect.bisect_right(self.all_apps, entry.sort_key, key=lambda x: x.sort_key)
+                self.all_apps.insert(i, entry)
+                if i < self.apps_offset:
+                    self.apps_offset += 1
+        self.apps_index.save()
+        self.prefix_indexes.pop(1, None)  # Lista zmieniła się w miejscu
+
+        # Przerysuj tylko, jeśli zmiana jest widoczna (siatka zmienia wyłącznie inne sloty)
+        shown_after = self.all_apps[self.apps_offset:self.apps_offset + self.visible_apps]
+        if hasattr(self, 'apps_frame') and shown_after != shown_before:
+            self.update_apps_display()
+            if self.selected_section == 1:
+                self.selected_index = min(self.selected_index, max(len(self.app_buttons) - 1, 0))
+                self.update_selection()
+        else:
+            self.schedule_preload()  # Zmiana mogła trafić na sąsiednią stronę
 
     def update_apps_display(self):
         if not hasattr(self, 'apps_frame'):
             return
-            
-        for widget in self.apps_frame.winfo_children():
-            widget.destroy()
-
-        self.app_buttons = []
 
         apps_to_show = self.all_apps[self.apps_offset:self.apps_offset + self.visible_apps]
+        self.app_buttons = self.apps_grid.render(apps_to_show, self.describe_app)
+        self.schedule_preload()
 
-        for i, app in enumerate(apps_to_show):
-            btn = ttk.Button(
-                self.apps_frame,
-                text=f"  {app['name']}",
-                style='Dark.TButton',
-                image=app.get('icon', self.icons['app']),
-                compound='left',
-                command=lambda a=app: self.launch_app(a)
-            )
-            btn.grid(row=i//4, column=i%4, padx=5, pady=5, sticky='ew')
-            self.app_buttons.append(btn)
+    def describe_app(self, app):
+        return f"  {app.name}", self.app_icon(app)
 
     def launch_app(self, app):
         try:
+            xdg_dirs = [os.path.join(d, 'applications') for d in xdg_data_dirs()]
+            if any(is_under(app.file, d) for d in xdg_dirs):
+                command = ["gtk-launch", app.id]
+            else:
+                # gtk-launch szuka tylko w katalogach XDG - plik Flatpak/Snap spoza nich uruchamia gio
+                command = ["gio", "launch", app.file]
             try:
-                subprocess.Popen(["gtk-launch", os.path.basename(app["file"])])
+                subprocess.Popen(command)
                 return
             except:
                 pass
 
             try:
-                subprocess.Popen(['bash', '-c', app["exec"]])
+                subprocess.Popen(['bash', '-c', app.exec])
                 return
             except Exception as e:
-                print(f"Error launching: {str(e)}")
+                apps_log.error("Error launching %s: %s", app.name, e)
 
             try:
-                subprocess.Popen(["xdg-open", app["file"]])
+                subprocess.Popen(["xdg-open", app.file])
                 return
             except:
                 pass
 
-            messagebox.showerror(self.tr('error'), f"{self.tr('could_not_launch_app')} {app['name']}") # Użycie tłumaczenia
+            messagebox.showerror(self.tr('error'), f"{self.tr('could_not_launch_app')} {app.name}") # Użycie tłumaczenia
         except Exception as e:
             messagebox.showerror(self.tr('error'), f"{self.tr('could_not_launch_app')} {str(e)}") # Użycie tłumaczenia
 
-    def load_media(self):
-        """Wczytuje filmy z folderu wideo"""
-        self.media_files = []
-        
+    def load_media(self, on_done=None, stream=True):
+        """Wczytuje filmy z folderu wideo (najpierw z migawki lub indeksu, potem skanowanie w tle)
+
+        Przy stream=False (ponowny skan) na ekranie zostaje poprzednia biblioteka,
+        dopóki nowa nie będzie gotowa. Escape w trakcie skanu go anuluje.
+        """
         # Sprawdź różne możliwe lokalizacje folderu Wideo
         video_dirs = [
             self.config['media_settings'].get('video_folder', os.path.expanduser('~/Videos')),
             os.path.expanduser('~/Videos'),
             os.path.expanduser('~/videos')
         ]
-        
-        found_videos = False
-        
-        for video_dir in video_dirs:
-            if os.path.exists(video_dir) and os.path.isdir(video_dir):
-                print(f"Searching for videos in: {video_dir}")
-                found_videos = self.scan_video_directory(video_dir)
-                if found_videos:
+        if self.scan_job:
+            self.scan_job.cancel()  # Wynik starszego skanu i tak zostałby odrzucony
+        if self.probe_job:
+            self.probe_job.cancel()  # Wznowi się po nowym skanie
+        job = self.scan_job = ScanProgress()
+        self.update_scan_progress(job)
+        self.run_in_background(
+            self.find_media_files, lambda result: self.on_scan_finished(job, result, on_done),
+            video_dirs, job, stream
+        )
+
+    def find_media_files(self, video_dirs, job, stream=True):
+        """Zwraca (filmy, katalog) z pierwszego katalogu, w którym coś znaleziono (wątek roboczy)"""
+        video_dirs = [os.path.normpath(d) for d in video_dirs if os.path.isdir(d)]
+        # Poprzednia biblioteka z indeksu trafia na ekran od razu, zanim skończy się skan
+        if self.media_root is None:
+            for video_dir in video_dirs:
+                # Migawka otwiera się w stałym czasie; indeks SQLite tylko, gdy jej brak
+                cached = self.media_library.open_snapshot(video_dir) or self.media_library.load(video_dir)
+                if cached:
+                    self.post_to_ui(self.on_media_loaded, cached, video_dir)
                     break
-        
-        if not found_videos:
-            # Jeśli nie znaleziono żadnych filmów, pokaż przykładowe
-            self.media_files = [
-                {"name": self.tr('no_videos_found'), "path": "", "icon": self.icons['mp4']}, # Użycie tłumaczenia
-                {"name": self.tr('add_videos'), "path": "", "icon": self.icons['mp4']} # Użycie tłumaczenia
-            ]
-        
-        if hasattr(self, 'movies_frame'):
-            self.update_movies_display()
 
-    def scan_video_directory(self, directory):
-        """Skanuje katalog w poszukiwaniu filmów"""
-        video_extensions = {'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.3gp'}
-        found_files = False
-        
-        try:
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    file_ext = os.path.splitext(file)[1].lower()
-                    if file_ext in video_extensions:
-                        file_path = os.path.join(root, file)
-                        file_name = os.path.splitext(file)[0]
-                        
-                        self.media_files.append({
-                            "name": file_name,
-                            "path": file_path,
-                            "icon": self.icons['mp4']
-                        })
-                        found_files = True
-                        print(f"Found video: {file_name}")
-            
-            # Sortuj alfabetycznie
-            self.media_files.sort(key=lambda x: x["name"])
-            
-        except Exception as e:
-            print(f"Error scanning directory {directory}: {str(e)}")
-        
-        return found_files
+        for video_dir in video_dirs:
+            scan_log.info("Searching for videos in: %s", video_dir)
+            try:
+                # Nowe pliki pokazujemy w trakcie skanu, partiami
+                for batch in self.media_library.scan(video_dir, progress=job):
+                    if stream and not job.is_cancelled:
+                        self.post_to_ui(self.add_media_batch, batch, video_dir)
+                if job.is_cancelled:
+                    return [], None
+                media_files = self.media_library.load(video_dir)
+            except Exception as e:
+                scan_log.error("Error scanning directory %s: %s", video_dir, e)
+                continue
+            if media_files:
+                # Lista z indeksu zostaje zastąpiona migawką - w pamięci tylko oglądane wpisy
+                return self.media_library.save_snapshot(video_dir, media_files), video_dir
+        return [], None
+
+    def on_scan_finished(self, job, result, on_done=None):
+        """Kończy zadanie skanowania: podmienia bibliotekę albo zostawia poprzednią po anulowaniu"""
+        if job is not self.scan_job:
+            return  # Zastąpione nowszym skanem
+        self.scan_job = None
+        if job.is_cancelled:
+            self.root.after(3000, self.hide_scan_progress)
+            return
+        self.hide_scan_progress()
+        self.on_media_loaded(*result, on_done)
+        if result[1]:
+            self.probe_media(result[1])
+
+    def probe_media(self, video_dir):
+        """Uruchamia w tle ffprobe dla nowych i zmienionych plików biblioteki"""
+        job = self.probe_job = ScanProgress()
+        self.run_in_background(self.run_media_probe, lambda _: self.on_probe_finished(job), video_dir, job)
+
+    def run_media_probe(self, video_dir, job):
+        """Wątek roboczy: przekazuje do UI kolejne partie wyników ffprobe"""
+        for batch in self.media_library.probe(video_dir, cancel=job.cancelled):
+            if job.is_cancelled:
+                break
+            self.post_to_ui(self.apply_probe_results, batch, video_dir)
+
+    def on_probe_finished(self, job):
+        if job is self.probe_job:
+            self.probe_job = None
+
+    def apply_probe_results(self, batch, video_dir):
+        """Dopisuje metadane z ffprobe do wpisów biblioteki na ekranie"""
+        if self.media_root != video_dir:
+            return
+        for path, info in batch.items():
+            i = self.find_media(path)
+            if i is not None:
+                for field, value in info.items():
+                    setattr(self.media_files[i], field, value)
+        self.update_movies_display()
+
+    def update_scan_progress(self, job):
+        """Odświeża licznik postępu skanu w dolnym pasku, dopóki zadanie trwa"""
+        if job is not self.scan_job or job.is_cancelled:
+            return
+        self.scan_status_label.config(text=self.tr('scan_progress') % (job.dirs, job.files, job.rate()))
+        if not self.scan_status_label.winfo_ismapped():
+            self.scan_status_label.pack(side='left', padx=10)
+        self.root.after(250, self.update_scan_progress, job)
+
+    def hide_scan_progress(self):
+        if self.scan_job is None:
+            self.scan_status_label.pack_forget()
+
+    def cancel_scan(self):
+        """Anuluje bieżący skan; zwraca False, jeśli żaden nie trwa"""
+        if self.scan_job is None or self.scan_job.is_cancelled:
+            return False
+        scan_log.info("Cancelling media scan")
+        self.scan_job.cancel()
+        self.scan_status_label.config(text=self.tr('scan_cancelled'))
+        return True
+
+    def media_anchor(self):
+        """(film, slot), który ma zostać w miejscu przy zmianie listy: wybrany albo pierwszy widoczny"""
+        if self.selected_section == 2 and self.movies_offset + self.selected_index < len(self.media_files):
+            return self.media_files[self.movies_offset + self.selected_index], self.selected_index
+        if self.movies_offset and self.movies_offset < len(self.media_files):
+            return self.media_files[self.movies_offset], 0
+        return None, 0
+
+    def set_media_files(self, media_files, anchor=None, anchor_slot=0):
+        """Podmienia listę filmów tak, żeby zakotwiczony film został w tym samym slocie siatki"""
+        self.media_files = media_files
+        offset = 0
+        if anchor and anchor.path:
+            i = self.find_media(anchor.path)
+            if i is not None:
+                offset = max(i - anchor_slot, 0)
+        self.movies_offset = min(offset, max(len(media_files) - self.visible_movies, 0))
 
+        if hasattr(self, 'movies_frame'):
+            # Siatka zmienia tylko sloty, których zawartość faktycznie jest inna
+            self.update_movies_display()
+            if self.selected_section == 2:
+                self.selected_index = min(self.selected_index, max(len(self.movie_buttons) - 1, 0))
+                self.update_selection()
+
+    def find_media(self, path):
+        """Indeks filmu o podanej ścieżce w posortowanej self.media_files albo None (O(log n))"""
+        key = sort_key(os.path.splitext(os.path.basename(path))[0])
+        i = bisect.bisect_left(self.media_files, key, key=lambda x: x.sort_key)
+        while i < len(self.media_files) and self.media_files[i].sort_key == key:
+            if self.media_files[i].path == path:
+                return i
+            i += 1
+        return None
+
+    def add_media_batch(self, batch, video_dir):
+        """Wstawia partię plików znalezionych w trakcie skanu w posortowane miejsca"""
+        if self.media_root not in (None, video_dir):
+            return  # Na ekranie jest inna biblioteka - zostaje do końca skanu
+        anchor, slot = self.media_anchor()
+        if self.media_root is None:
+            self.media_root = video_dir
+            media_files = []  # Usuń przykładowe wpisy "brak filmów"
+            self.profiler.mark('media_first_batch')
+        else:
+            media_files = self.media_files
+        batch.sort(key=lambda x: x.sort_key)
+        if isinstance(media_files, (MediaSnapshot, MediaOverlay)):
+            # Migawka zostaje w pamięci mapowanej - nowe pliki idą do nakładki scalanej przy odczycie
+            media_files = MediaOverlay.extend(media_files, batch)
+        else:
+            # Dwie posortowane serie - Timsort scala je w czasie liniowym
+            media_files = media_files + batch
+            media_files.sort(key=lambda x: x.sort_key)
+        self.set_media_files(media_files, anchor, slot)
+
+    def on_media_loaded(self, media_files, video_dir=None, on_done=None):
+        """Podmienia bibliotekę multimediów po zakończeniu skanowania"""
+        anchor, slot = self.media_anchor()
+        if not media_files:
+            # Jeśli nie znaleziono żadnych filmów, pokaż przykładowe
+            media_files = [
+                PlaceholderEntry(self.tr('no_videos_found')), # Użycie tłumaczenia
+                PlaceholderEntry(self.tr('add_videos')) # Użycie tłumaczenia
+            ]
+        self.media_root = video_dir
+        self.set_media_files(media_files, anchor, slot)
+        self.profiler.mark('media_ready')
+        if on_done:
+            on_done()
 
     def update_movies_display(self):
         if not hasattr(self, 'movies_frame'):
             return
-            
-        for widget in self.movies_frame.winfo_children():
-            widget.destroy()
-
-        self.movie_buttons = []
 
         movies_to_show = self.media_files[self.movies_offset:self.movies_offset + self.visible_movies]
+        neighbours = [media for page in self.neighbour_pages(self.media_files, self.movies_offset,
+                                                             self.visible_movies) for media in page]
+        # Najpierw miniatury widocznych kafelków, potem następnej i poprzedniej strony
+        self.thumbnails.request(movies_to_show, neighbours)
+        self.movie_buttons = self.movies_grid.render(movies_to_show, self.describe_movie)
+        self.thumbnails.retain(movies_to_show + neighbours)
+        self.schedule_preload()
+
+    def describe_movie(self, media):
+        return self.movie_label(media), self.movie_icon(media)
+
+    @staticmethod
+    def neighbour_pages(items, offset, visible):
+        """Elementy następnej i poprzedniej strony (w tej kolejności), na które przeskoczy Page Down/Up"""
+        return [items[start:start + visible]
+                for start in reversed(page_offsets(offset, visible, len(items))) if start is not None]
+
+    def schedule_preload(self):
+        """Po wyrysowaniu bieżących stron przygotowuje poza ekranem sąsiednie"""
+        if self.preload_job is None:
+            self.preload_job = self.root.after_idle(self.preload_pages)
+
+    def preload_pages(self):
+        self.preload_job = None
+        if hasattr(self, 'apps_frame'):
+            for page in self.neighbour_pages(self.all_apps, self.apps_offset, self.visible_apps):
+                self.apps_grid.preload(page, self.describe_app)
+        if hasattr(self, 'movies_frame'):
+            for page in self.neighbour_pages(self.media_files, self.movies_offset, self.visible_movies):
+                self.movies_grid.preload(page, self.describe_movie)
+
+    def movie_label(self, media):
+        """Nazwa filmu z oznaczeniem 4K i czasem trwania (jeśli ffprobe je już podał)"""
+        flags = []
+        if (media.width or 0) >= 3840 or (media.height or 0) >= 2160:
+            flags.append('4K')
+        if media.duration:
+            minutes, seconds = divmod(int(media.duration), 60)
+            hours, minutes = divmod(minutes, 60)
+            flags.append(f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}")
+        if flags:
+            return f"  {media.name}  [{' · '.join(flags)}]"
+        return f"  {media.name}"
+
+    def movie_icon(self, media):
+        """Miniatura filmu (albo zastępcza ikona, dopóki jej nie ma)"""
+        return self.thumbnails.photo(media) or self.icons['mp4']
+
+    def on_thumbnail_ready(self):
+        if hasattr(self, 'movies_frame'):
+            self.update_movies_display()
+            self.update_selection()
 
-        for i, media in enumerate(movies_to_show):
-            btn = ttk.Button(
-                self.movies_frame,
-                text=f"  {media['name']}",
-                style='Dark.TButton',
-                image=media.get('icon', self.icons['mp4']),
-                compound='left',
-                command=lambda m=media: self.select_movie(m)
-            )
-            btn.grid(row=i//4, column=i%4, padx=5, pady=5, sticky='ew')
-            self.movie_buttons.append(btn)
+    def start_warm_vlc(self):
+        """Uruchamia VLC z interfejsem RC w tle (tylko w trybie 'warm')"""
+        if self.config['media_settings'].get('vlc_mode') != 'warm':
+            return
+        if self.vlc_remote is not None and self.vlc_remote.alive:
+            return
+        try:
+            remote = VLCRemote(['--fullscreen', '--no-video-title-show'], interface='-I', mode='warm')
+        except OSError as e:
+            player_log.warning("Could not start warm VLC, using one process per file: %s", e)
+            return
+        self.run_in_background(self.connect_warm_vlc, self.on_warm_vlc_ready, remote)
+
+    @staticmethod
+    def connect_warm_vlc(remote):
+        try:
+            return remote.connect()
+        except OSError as e:
+            player_log.warning("Warm VLC did not open its RC socket, using one process per file: %s", e)
+            remote.close()
+            return None
+
+    def on_warm_vlc_ready(self, remote):
+        if remote is None:
+            return
+        self.vlc_remote = remote
+        player_log.info("Warm VLC ready (pid %d)", remote.process.pid)
+
+    def warm_vlc(self):
+        """Ciepły VLC, jeśli działa; martwy jest uruchamiany ponownie na następny raz"""
+        if self.vlc_remote is not None and not self.vlc_remote.alive:
+            self.vlc_remote.close()
+            self.vlc_remote = None
+            self.start_warm_vlc()
+        return self.vlc_remote
+
+    def play_queue(self, file_path):
+        """Kolejka odtwarzania: file_path i dalsze pliki z jego folderu w kolejności odcinków albo nazw"""
+        order = self.config['media_settings'].get('play_queue', 'episode')
+        if order == 'off':
+            return [file_path]
+        directory = os.path.dirname(file_path)
+        try:
+            paths = self.media_library.files_in(directory)
+        except sqlite3.Error as e:
+            player_log.warning("Media index unavailable, listing %s instead: %s", directory, e)
+            paths = []
+        if file_path not in paths:
+            # Plik spoza biblioteki (np. z okna wyboru pliku)
+            try:
+                paths = [entry.path for entry in os.scandir(directory)
+                         if os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS]
+            except OSError:
+                return [file_path]
+            if file_path not in paths:
+                return [file_path]
+        paths = order_play_queue(paths, order)
+        return paths[paths.index(file_path):]
+
+    def open_in_player(self, file_path, requested_at=None):
+        """Odtwarza file_path z kolejką budowaną w osobnym wątku - indeks SQLite może być zajęty przez skan"""
+        requested_at = requested_at or time.perf_counter()
+
+        def build():
+            try:
+                queue = self.play_queue(file_path)
+            except Exception as e:
+                player_log.warning("Error building play queue for %s: %s", file_path, e)
+                queue = [file_path]
+            self.post_to_ui(self.play_with_queue, file_path, requested_at, queue)
+
+        threading.Thread(target=build, name='play-queue', daemon=True).start()
+
+    def play_with_queue(self, file_path, requested_at, queue):
+        if not self.media_player or not tk.Toplevel.winfo_exists(self.media_player.player_window):
+            # Przekazanie self.tr
+            self.media_player = self.create_media_player()
+        self.media_player.open_file(file_path, requested_at, queue)
+
+    def create_media_player(self):
+        embedded = self.config['media_settings'].get('vlc_mode') == 'embedded'
+        return MediaPlayer(self.root, self.on_media_player_close, self.tr, self.warm_vlc(), embedded=embedded)
+
+    def shutdown(self):
+        """Sprząta procesy i wątki pomocnicze po zamknięciu okna"""
+        # Wątki puli są dołączane przy wyjściu z interpretera - trwający skan lub ffprobe
+        # wstrzymałby zamknięcie do końca pracy
+        for job in (self.scan_job, self.probe_job):
+            if job is not None:
+                job.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.thumbnails.close()
+        if self.vlc_remote is not None:
+            self.vlc_remote.close()
 
     def select_movie(self, media):
         """Odtwarza wybrany film w VLC na fullscreen"""
-        if media.get("path") and os.path.exists(media["path"]):
-            if not self.media_player or not tk.Toplevel.winfo_exists(self.media_player.player_window):
-                # Przekazanie self.tr
-                self.media_player = MediaPlayer(self.root, self.on_media_player_close, self.tr)
-            self.media_player.open_file(media["path"])
-        elif media.get("path"):
-            messagebox.showerror(self.tr('error'), f"{self.tr('file_not_found')} {media['path']}") # Użycie tłumaczenia
+        requested_at = time.perf_counter()
+        if media.path and os.path.exists(media.path):
+            self.open_in_player(media.path, requested_at)
+        elif media.path:
+            messagebox.showerror(self.tr('error'), f"{self.tr('file_not_found')} {media.path}") # Użycie tłumaczenia
         else:
-            messagebox.showinfo("Info", media['name'])
+            messagebox.showinfo("Info", media.name)
 
     def on_media_player_close(self):
         """Callback triggered after the player closes"""
@@ -1185,7 +3895,7 @@ class StreamingLauncher:
         elif url == "media_player":
             if not self.media_player or not tk.Toplevel.winfo_exists(self.media_player.player_window):
                 # Przekazanie self.tr
-                self.media_player = MediaPlayer(self.root, self.on_media_player_close, self.tr)
+                self.media_player = self.create_media_player()
                 # Open file dialog
                 file_path = filedialog.askopenfilename(
                     title=self.tr('select_multimedia_file'), # Użycie tłumaczenia
@@ -1195,11 +3905,12 @@ class StreamingLauncher:
                     )
                 )
                 if file_path:
-                    self.media_player.open_file(file_path)
+                    self.open_in_player(os.path.normpath(file_path))
             else:
                 self.media_player.player_window.lift()
         elif url:
             try:
+                lazy_import('qtpy')  # Backend Qt dla pywebview
                 window = webview.create_window(
                     'Streaming',
                     url,
@@ -1227,9 +3938,12 @@ class StreamingLauncher:
         self.root.bind('<Up>', lambda e: self.move_section(-1))
         self.root.bind('<Down>', lambda e: self.move_section(1))
         self.root.bind('<Return>', lambda e: self.press_selected())
-        self.root.bind('<Escape>', lambda e: self.root.destroy())
+        # Escape w trakcie skanu multimediów przerywa skan zamiast zamykać launcher
+        self.root.bind('<Escape>', lambda e: self.cancel_scan() or self.root.destroy())
         self.root.bind('<Prior>', lambda e: self.scroll_up())  # Page Up
         self.root.bind('<Next>', lambda e: self.scroll_down())  # Page Down
+        # Litery i cyfry - skok do pierwszej aplikacji/filmu o takim początku nazwy
+        self.root.bind('<KeyPress>', self.on_key_press)
 
     def move_section(self, direction):
         new_section = self.selected_section + direction
@@ -1238,95 +3952,124 @@ class StreamingLauncher:
             self.selected_index = 0
             self.update_selection()
 
+    def section_window(self):
+        """(offset, widoczne, wszystkie) siatki w bieżącej sekcji albo None dla platform"""
+        if self.selected_section == 1:
+            return self.apps_offset, self.visible_apps, len(self.all_apps)
+        if self.selected_section == 2:
+            return self.movies_offset, self.visible_movies, len(self.media_files)
+        return None
+
     def move_selection(self, direction):
-        max_index = 0
         if self.selected_section == 0:
-            max_index = len(self.platform_buttons) - 1
-        elif self.selected_section == 1:
-            if hasattr(self, 'app_buttons'):
-                max_index = min(self.visible_apps, len(self.all_apps)) - 1
-            else:
-                max_index = 0
-        elif self.selected_section == 2:
-            if hasattr(self, 'movie_buttons'):
-                max_index = min(self.visible_movies, len(self.media_files)) - 1
-            else:
-                max_index = 0
+            new_index = self.selected_index + direction
+            if 0 <= new_index < len(self.platform_buttons):
+                self.selected_index = new_index
+                self.update_selection()
+            return
 
-        new_index = self.selected_index + direction
-        if 0 <= new_index <= max_index:
-            self.selected_index = new_index
-            self.update_selection()
-        elif direction > 0 and self.selected_section == 1 and (self.apps_offset + self.visible_apps) < len(self.all_apps):
-            self.apps_offset += 1
-            if hasattr(self, 'apps_frame'):
-                self.update_apps_display()
-            self.update_selection()
-        elif direction < 0 and self.selected_section == 1 and self.apps_offset > 0:
-            self.apps_offset -= 1
-            if hasattr(self, 'apps_frame'):
-                self.update_apps_display()
-            self.update_selection()
-        elif direction > 0 and self.selected_section == 2 and (self.movies_offset + self.visible_movies) < len(self.media_files):
-            self.movies_offset += 1
-            if hasattr(self, 'movies_frame'):
-                self.update_movies_display()
-            self.update_selection()
-        elif direction < 0 and self.selected_section == 2 and self.movies_offset > 0:
-            self.movies_offset -= 1
-            if hasattr(self, 'movies_frame'):
-                self.update_movies_display()
+        offset, visible, total = self.section_window()
+        target = offset + self.selected_index + direction
+        if not 0 <= target < total:
+            return
+        if 0 <= self.selected_index + direction < min(visible, total - offset):
+            self.selected_index += direction
             self.update_selection()
+        else:
+            # Wyjście poza krawędź siatki przełącza na sąsiednią stronę
+            start = page_offsets(offset, visible, total)[direction > 0]
+            self.show_page(start, target - start)
 
     def scroll_up(self):
-        if self.selected_section == 1 and self.apps_offset > 0:
-            self.apps_offset -= 1
-            if hasattr(self, 'apps_frame'):
-                self.update_apps_display()
-            self.update_selection()
-        elif self.selected_section == 2 and self.movies_offset > 0:
-            self.movies_offset -= 1
-            if hasattr(self, 'movies_frame'):
-                self.update_movies_display()
-            self.update_selection()
+        """Page Up - poprzednia strona (przygotowana poza ekranem, więc to tylko zamiana ramek)"""
+        self.scroll_page(0)
 
     def scroll_down(self):
-        if self.selected_section == 1 and (self.apps_offset + self.visible_apps) < len(self.all_apps):
-            self.apps_offset += 1
+        """Page Down - następna strona"""
+        self.scroll_page(1)
+
+    def scroll_page(self, which):
+        """Przechodzi w bieżącej sekcji na stronę page_offsets()[which]"""
+        window = self.section_window()
+        if window is None:
+            return
+        start = page_offsets(*window)[which]
+        if start is not None:
+            self.show_page(start)
+
+    def show_page(self, offset, slot=None):
+        """Pokazuje w bieżącej sekcji stronę od offset i zaznacza slot (domyślnie dotychczasowy)"""
+        if self.selected_section == 1:
+            self.apps_offset = offset
             if hasattr(self, 'apps_frame'):
                 self.update_apps_display()
-            self.update_selection()
-        elif self.selected_section == 2 and (self.movies_offset + self.visible_movies) < len(self.media_files):
-            self.movies_offset += 1
+            buttons = self.app_buttons
+        else:
+            self.movies_offset = offset
             if hasattr(self, 'movies_frame'):
                 self.update_movies_display()
-            self.update_selection()
+            buttons = self.movie_buttons
+        slot = self.selected_index if slot is None else slot
+        self.selected_index = min(slot, max(len(buttons) - 1, 0))
+        self.update_selection()
 
-    def update_selection(self):
-        # Platform buttons
-        for btn in self.platform_buttons:
-            # Użycie oryginalnych kolorów dla nieaktywnych
-            index = self.platform_buttons.index(btn)
-            btn.config(bg=self.platforms[index]["color"], font=('Arial', 14, 'normal'), fg='white')
+    def on_key_press(self, event):
+        """Litera lub cyfra w siatce: skok do pierwszej pasującej nazwy, kolejne znaki zawężają prefiks"""
+        if self.selected_section == 0 or len(event.char) != 1 or not event.char.isalnum():
+            return
+        now = time.monotonic()
+        if now - self.typeahead_at > TYPEAHEAD_TIMEOUT:
+            self.typeahead = ''
+        self.typeahead += event.char
+        self.typeahead_at = now
+        self.jump_to_prefix(self.typeahead)
+
+    def prefix_index(self):
+        """PrefixIndex listy bieżącej sekcji - nowy, jeśli lista została podmieniona"""
+        items = self.all_apps if self.selected_section == 1 else self.media_files
+        index = self.prefix_indexes.get(self.selected_section)
+        if index is None or index.items is not items:
+            index = self.prefix_indexes[self.selected_section] = PrefixIndex(items)
+        return index
+
+    def jump_to_prefix(self, prefix):
+        i = self.prefix_index().find(prefix)
+        if i is None:
+            return
+        _, visible, total = self.section_window()
+        start = page_start(i, visible, total)
+        self.show_page(start, i - start)
 
-        # App buttons
-        for btn in self.app_buttons:
-            btn.config(style='Dark.TButton')
+    def selected_button(self):
+        """Przycisk wskazywany przez selected_section/selected_index (albo None)"""
+        buttons = (self.platform_buttons, self.app_buttons, self.movie_buttons)[self.selected_section]
+        if 0 <= self.selected_index < len(buttons):
+            return buttons[self.selected_index]
+        return None
 
-        # Movie buttons
-        for btn in self.movie_buttons:
-            btn.config(style='Dark.TButton')
+    def update_selection(self):
+        """Przestylowuje tylko poprzednio i obecnie wybrany przycisk"""
+        target = self.selected_button()
+        previous = self.highlighted
+        if previous and previous[2] is not target:
+            section, index, btn = previous
+            if section == 0:
+                # Użycie oryginalnych kolorów dla nieaktywnych
+                btn.config(bg=self.platforms[index]["color"], font=('Arial', 14, 'normal'), fg='white')
+            else:
+                btn.config(style='Dark.TButton')
 
-        if self.selected_section == 0 and self.platform_buttons:
-            # Akcentowanie przycisku platformy
-            self.platform_buttons[self.selected_index].config(bg='white', fg='black')
-            self.platform_buttons[self.selected_index].focus_set()
-        elif self.selected_section == 1 and self.app_buttons:
-            self.app_buttons[self.selected_index].config(style='Selected.TButton')
-            self.app_buttons[self.selected_index].focus_set()
-        elif self.selected_section == 2 and self.movie_buttons:
-            self.movie_buttons[self.selected_index].config(style='Selected.TButton')
-            self.movie_buttons[self.selected_index].focus_set()
+        if target is None:
+            self.highlighted = None
+            return
+        if not previous or previous[2] is not target:
+            if self.selected_section == 0:
+                # Akcentowanie przycisku platformy
+                target.config(bg='white', fg='black')
+            else:
+                target.config(style='Selected.TButton')
+        target.focus_set()
+        self.highlighted = (self.selected_section, self.selected_index, target)
 
     def press_selected(self):
         if self.selected_section == 0 and self.platform_buttons:
@@ -1336,13 +4079,32 @@ class StreamingLauncher:
         elif self.selected_section == 2 and self.movie_buttons:
             self.movie_buttons[self.selected_index].invoke()
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="TV Launcher")
+    parser.add_argument('--profile-startup', nargs='?', const=STARTUP_PROFILE_FILE, default=None,
+                        metavar='FILE', help="record startup phase timings to FILE (JSON + .txt table)")
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        type=str.upper, help="log verbosity (DEBUG also lists every scanned file)")
+    parser.add_argument('--debug', action='store_const', const='DEBUG', dest='log_level',
+                        help="shortcut for --log-level DEBUG")
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+
 if __name__ == "__main__":
-    root = tk.Tk()
+    args = parse_args()
+    setup_logging(args.log_level)
+    profiler = StartupProfiler(args.profile_startup)
+    with profiler.phase('tk_init'):
+        root = tk.Tk()
 
     # Create button styles
     style = ttk.Style()
     # Zostawiamy styl Selected.TButton, ale kolor będzie brany z config.accent_color
     style.configure('Selected.TButton', background='#FF5500') 
 
-    app = StreamingLauncher(root)
-    root.mainloop()
+    app = StreamingLauncher(root, profiler)
+    try:
+        root.mainloop()
+    finally:
+        app.shutdown()